@@ -0,0 +1 @@
+"""Example applications for PocketPy (runnable via ``python -m examples.<name>``)"""
@@ -0,0 +1,16 @@
+"""
+Pytest configuration for the examples.
+
+Puts the repository root on sys.path exactly once so the examples can
+import pocketpy without each module inserting its own path entry at
+import time (which forces importlib to rescan finders per import).
+For standalone runs, install the package (`pip install -e .`) or run
+from the repo root with `python -m examples.counter_app`.
+"""
+
+import sys
+from pathlib import Path
+
+_repo_root = str(Path(__file__).parent.parent)
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
@@ -7,11 +7,11 @@ A more advanced example showing:
 - Button styling with hover effects
 """
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pocketpy import App, View, State, VBox, HBox, Label, Button
+from pocketpy.core.theme import (
+    COLOR_PRIMARY, COLOR_SUCCESS, COLOR_DANGER,
+    COLOR_GRAY, COLOR_WHITE, COLOR_BACKGROUND
+)
 
 
 class CounterView(View):
@@ -21,6 +21,11 @@ class CounterView(View):
         super().__init__()
         self.count = State(0)
         self.step = State(1)
+        # One handler per step size, built once; body() reuses them so
+        # handler identity is stable across rebuilds
+        self._set_step_handlers = {
+            n: (lambda n=n: self.set_step(n)) for n in (1, 5, 10)
+        }
     
     def increment(self):
         """Increment counter by step value."""
@@ -63,12 +68,12 @@ class CounterView(View):
                         Label(
                             text=self.count,
                             font_size=64,
-                            color="#007AFF",
+                            color=COLOR_PRIMARY,
                             text_align="center",
                             padding=(10, 0)
                         ),
                     ],
-                    background_color="#FFFFFF",
+                    background_color=COLOR_WHITE,
                     padding=(30, 20),
                     margin=(10, 10)
                 ),
@@ -79,7 +84,7 @@ class CounterView(View):
                         Button(
                             text="-",
                             on_press=self.decrement,
-                            background_color="#FF3B30",
+                            background_color=COLOR_DANGER,
                             font_size=24,
                             width=80,
                             height=60
@@ -87,7 +92,7 @@ class CounterView(View):
                         Button(
                             text="+",
                             on_press=self.increment,
-                            background_color="#34C759",
+                            background_color=COLOR_SUCCESS,
                             font_size=24,
                             width=80,
                             height=60
@@ -109,22 +114,22 @@ class CounterView(View):
                     children=[
                         Button(
                             text="1",
-                            on_press=lambda: self.set_step(1),
-                            background_color="#007AFF",
+                            on_press=self._set_step_handlers[1],
+                            background_color=COLOR_PRIMARY,
                             width=60,
                             height=40
                         ),
                         Button(
                             text="5",
-                            on_press=lambda: self.set_step(5),
-                            background_color="#007AFF",
+                            on_press=self._set_step_handlers[5],
+                            background_color=COLOR_PRIMARY,
                             width=60,
                             height=40
                         ),
                         Button(
                             text="10",
-                            on_press=lambda: self.set_step(10),
-                            background_color="#007AFF",
+                            on_press=self._set_step_handlers[10],
+                            background_color=COLOR_PRIMARY,
                             width=60,
                             height=40
                         ),
@@ -137,14 +142,14 @@ class CounterView(View):
                 Button(
                     text="Reset",
                     on_press=self.reset,
-                    background_color="#8E8E93",
+                    background_color=COLOR_GRAY,
                     width=200,
                     padding=(12, 0),
                     margin=(20, 0)
                 ),
             ],
             spacing=10,
-            background_color="#F2F2F7",
+            background_color=COLOR_BACKGROUND,
             padding=(0, 0)
         )
 
@@ -9,6 +9,7 @@ This example demonstrates the basics of building a PocketPy app:
 """
 
 from pocketpy import App, View, State, VBox, Label, Button
+from pocketpy.core.theme import COLOR_PRIMARY, COLOR_DANGER
 
 
 class HelloWorldView(View):
@@ -41,19 +42,19 @@ class HelloWorldView(View):
                 Label(
                     text=self.counter,
                     font_size=48,
-                    color="#007AFF",
+                    color=COLOR_PRIMARY,
                     padding=(10, 20)
                 ),
                 Button(
                     text="Increment",
                     on_press=self.increment,
-                    background_color="#007AFF",
+                    background_color=COLOR_PRIMARY,
                     padding=(12, 24)
                 ),
                 Button(
                     text="Reset",
                     on_press=self.reset,
-                    background_color="#FF3B30",
+                    background_color=COLOR_DANGER,
                     padding=(12, 24)
                 ),
             ],
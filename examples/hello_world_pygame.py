@@ -8,11 +8,9 @@ This example demonstrates PocketPy with actual graphical rendering:
 - Counter increments when you click the button
 """
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pocketpy import App, View, State, VBox, Label, Button
+from pocketpy.core import log
+from pocketpy.core.theme import COLOR_PRIMARY, COLOR_DANGER
 
 
 class HelloWorldView(View):
@@ -27,12 +25,12 @@ class HelloWorldView(View):
     def increment(self):
         """Increment the counter."""
         self.counter.value += 1
-        print(f"Counter incremented to: {self.counter.value}")
-    
+        log.debug("Counter incremented to: %d", self.counter.value)
+
     def reset(self):
         """Reset the counter to zero."""
         self.counter.value = 0
-        print("Counter reset to 0")
+        log.debug("Counter reset to 0")
     
     def body(self):
         """Define the UI structure."""
@@ -47,19 +45,19 @@ class HelloWorldView(View):
                 Label(
                     text=self.counter,
                     font_size=48,
-                    color="#007AFF",
+                    color=COLOR_PRIMARY,
                     padding=(10, 20)
                 ),
                 Button(
                     text="Increment",
                     on_press=self.increment,
-                    background_color="#007AFF",
+                    background_color=COLOR_PRIMARY,
                     padding=(12, 24)
                 ),
                 Button(
                     text="Reset",
                     on_press=self.reset,
-                    background_color="#FF3B30",
+                    background_color=COLOR_DANGER,
                     padding=(12, 24)
                 ),
             ],
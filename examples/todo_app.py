@@ -3,20 +3,25 @@ Todo App Demo
 A complete todo list application showcasing PocketPy framework
 """
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pocketpy import (
-    App, View, State, Theme,
+    App, View, State, Memo, Theme,
     VBox, HBox, Card, Spacer, Divider,
     Label, Button, TextInput, Switch
 )
+from pocketpy.core import log
+from pocketpy.core.theme import (
+    COLOR_PRIMARY, COLOR_SUCCESS, COLOR_DANGER,
+    COLOR_GRAY, COLOR_TEXT, COLOR_TEXT_SECONDARY
+)
 
 
 class TodoItem:
     """Todo item data class"""
-    def __init__(self, text: str, completed: bool = False):
+
+    __slots__ = ("id", "text", "completed")
+
+    def __init__(self, id: int, text: str, completed: bool = False):
+        self.id = id
         self.text = text
         self.completed = State(completed)
 
@@ -27,182 +32,254 @@ class TodoAppView(View):
     def __init__(self):
         super().__init__()
         
-        # State
-        self.todos: list[TodoItem] = [
-            TodoItem("Build mobile framework", True),
-            TodoItem("Add beautiful widgets", True),
-            TodoItem("Create demo apps", False),
-            TodoItem("Deploy to production", False),
-        ]
+        # State (dict keyed by id so deletion is O(1) instead of a list scan)
+        self.todos: dict[int, TodoItem] = {
+            item.id: item for item in (
+                TodoItem(0, "Build mobile framework", True),
+                TodoItem(1, "Add beautiful widgets", True),
+                TodoItem(2, "Create demo apps", False),
+                TodoItem(3, "Deploy to production", False),
+            )
+        }
+        self._next_id = 4
         self.new_todo_text = State("")
         self.filter_completed = State(False)
         self.refresh = State(0)  # Trigger rebuilds
+
+        # Incrementally maintained stats (avoid rescanning todos per render)
+        self._total = len(self.todos)
+        self._completed = sum(1 for t in self.todos.values() if t.completed.value)
+        self._completed_todos = [t for t in self.todos.values() if t.completed.value]
+
+        # Pre-composed constant panels: built once, spliced into every body()
+        self._header_stats_label = Label(
+            text=self._stats_text(),
+            font_size=14,
+            color=COLOR_GRAY
+        )
+        self._header_card = self._build_header()
+        self._add_card = self._build_add_card()
+        self._filter_card = self._build_filter_card()
+        self._divider = Divider()
+        self._footer = Label(
+            text="Built with PocketPy Framework",
+            font_size=12,
+            color=COLOR_GRAY
+        )
+
+        # Memoized per-todo cards: rebuilt only when their State inputs change
+        self._todo_memos = {}
     
-    def add_todo(self):
-        """Add a new todo"""
+    def add_todo(self, _submitted_text: str = "") -> None:
+        """Add a new todo (the submit callback's text arg is unused)"""
         text = self.new_todo_text.value.strip()
         if text:
-            self.todos.append(TodoItem(text))
+            todo_id = self._next_id
+            self._next_id += 1
+            self.todos[todo_id] = TodoItem(todo_id, text)
+            self._total += 1
             self.new_todo_text.value = ""
             self.refresh.value += 1
-            print(f"✅ Added todo: {text}")
+            log.debug("✅ Added todo: %s", text)
     
+    def _on_toggle(self, value: bool, todo: TodoItem):
+        """Shared Switch handler; the todo arrives as the widget's user_data"""
+        # The switch has already written `value` into todo.completed;
+        # only the derived bookkeeping needs to catch up
+        self._apply_completion(todo, value)
+
     def toggle_todo(self, todo: TodoItem):
         """Toggle todo completion"""
-        todo.completed.value = not todo.completed.value
-        status = "completed" if todo.completed.value else "incomplete"
-        print(f"📝 Todo '{todo.text}' marked as {status}")
+        new_value = not todo.completed.value
+        todo.completed.value = new_value
+        self._apply_completion(todo, new_value)
+
+    def _apply_completion(self, todo: TodoItem, completed: bool) -> None:
+        """Sync the incremental stats with a todo's new completion value"""
+        if completed:
+            self._completed += 1
+            self._completed_todos.append(todo)
+        else:
+            self._completed -= 1
+            self._completed_todos.remove(todo)
+        status = "completed" if completed else "incomplete"
+        log.debug("📝 Todo '%s' marked as %s", todo.text, status)
     
     def delete_todo(self, todo: TodoItem):
         """Delete a todo"""
-        self.todos.remove(todo)
+        del self.todos[todo.id]
+        self._todo_memos.pop(todo, None)
+        self._total -= 1
+        if todo.completed.value:
+            self._completed -= 1
+            self._completed_todos.remove(todo)
         self.refresh.value += 1
-        print(f"🗑️  Deleted todo: {todo.text}")
+        log.debug("🗑️  Deleted todo: %s", todo.text)
     
+    def _on_filter_change(self, _value: bool) -> None:
+        """Force a rebuild when the completed-only filter flips"""
+        self.refresh.value += 1
+
     def get_visible_todos(self):
         """Get todos based on filter"""
         if self.filter_completed.value:
-            return [t for t in self.todos if t.completed.value]
-        return self.todos
-    
+            return self._completed_todos
+        return list(self.todos.values())
+
     def get_stats(self):
         """Get todo statistics"""
-        total = len(self.todos)
-        completed = sum(1 for t in self.todos if t.completed.value)
-        remaining = total - completed
-        return total, completed, remaining
-    
-    def body(self):
+        return self._total, self._completed, self._total - self._completed
+
+    def _stats_text(self):
+        """Format the header statistics line"""
         total, completed, remaining = self.get_stats()
-        visible_todos = self.get_visible_todos()
-        
-        # Build todo item cards
-        todo_cards = []
-        for todo in visible_todos:
-            todo_card = Card(
-                children=[
-                    HBox(
-                        children=[
-                            # Checkbox (switch)
-                            Switch(
-                                value=todo.completed,
-                                on_change=lambda val, t=todo: self.toggle_todo(t)
-                            ),
-                            
-                            # Todo text
-                            Label(
-                                text=todo.text,
-                                font_size=16,
-                                color="#8E8E93" if todo.completed.value else "#000000"
-                            ),
-                            
-                            Spacer(),
-                            
-                            # Delete button
-                            Button(
-                                text="Delete",
-                                font_size=14,
-                                background_color="#FF3B30",
-                                on_press=lambda t=todo: self.delete_todo(t)
-                            )
-                        ],
-                        spacing=12
-                    )
-                ],
-                elevation="sm",
-                padding=16,
-                margin=(8, 0)
-            )
-            todo_cards.append(todo_card)
-        
-        return VBox(
+        return f"{remaining} remaining • {completed} completed"
+
+    def _build_header(self):
+        """Build the header card around the shared stats label"""
+        return Card(
+            children=[
+                Label(
+                    text="📝 Todo App",
+                    font_size=32,
+                    color=COLOR_PRIMARY
+                ),
+                self._header_stats_label
+            ],
+            elevation="lg",
+            padding=20
+        )
+
+    def _build_add_card(self):
+        """Build the add-todo card"""
+        return Card(
+            children=[
+                Label(
+                    text="Add New Todo",
+                    font_size=18,
+                    color=COLOR_TEXT
+                ),
+                TextInput(
+                    value=self.new_todo_text,
+                    placeholder="What needs to be done?",
+                    font_size=16,
+                    on_submit=self.add_todo
+                ),
+                Button(
+                    text="Add Todo",
+                    font_size=16,
+                    background_color=COLOR_SUCCESS,
+                    on_press=self.add_todo
+                )
+            ],
+            elevation="md",
+            padding=16,
+            margin=(12, 0)
+        )
+
+    def _build_filter_card(self):
+        """Build the filter card"""
+        return Card(
             children=[
-                # Header
-                Card(
+                HBox(
                     children=[
                         Label(
-                            text="📝 Todo App",
-                            font_size=32,
-                            color="#007AFF"
-                        ),
-                        Label(
-                            text=f"{remaining} remaining • {completed} completed",
+                            text="Show Completed Only",
                             font_size=14,
-                            color="#8E8E93"
+                            color=COLOR_TEXT_SECONDARY
+                        ),
+                        Spacer(),
+                        Switch(
+                            value=self.filter_completed,
+                            on_change=self._on_filter_change
                         )
                     ],
-                    elevation="lg",
-                    padding=20
-                ),
-                
-                # Add todo section
-                Card(
+                    spacing=12
+                )
+            ],
+            elevation="sm",
+            padding=12,
+            margin=(12, 0)
+        )
+
+    def _build_todo_card(self, todo: TodoItem):
+        """Build a single todo item card"""
+        return Card(
+            children=[
+                HBox(
                     children=[
-                        Label(
-                            text="Add New Todo",
-                            font_size=18,
-                            color="#000000"
+                        # Checkbox (switch)
+                        Switch(
+                            value=todo.completed,
+                            on_change=self._on_toggle,
+                            user_data=todo
                         ),
-                        TextInput(
-                            value=self.new_todo_text,
-                            placeholder="What needs to be done?",
+
+                        # Todo text
+                        Label(
+                            text=todo.text,
                             font_size=16,
-                            on_submit=lambda text: self.add_todo()
+                            color=COLOR_GRAY if todo.completed.value else COLOR_TEXT
                         ),
+
+                        Spacer(),
+
+                        # Delete button
                         Button(
-                            text="Add Todo",
-                            font_size=16,
-                            background_color="#34C759",
-                            on_press=self.add_todo
-                        )
-                    ],
-                    elevation="md",
-                    padding=16,
-                    margin=(12, 0)
-                ),
-                
-                # Filter section
-                Card(
-                    children=[
-                        HBox(
-                            children=[
-                                Label(
-                                    text="Show Completed Only",
-                                    font_size=14,
-                                    color="#3C3C43"
-                                ),
-                                Spacer(),
-                                Switch(
-                                    value=self.filter_completed,
-                                    on_change=lambda val: setattr(self.refresh, 'value', self.refresh.value + 1)
-                                )
-                            ],
-                            spacing=12
+                            text="Delete",
+                            font_size=14,
+                            background_color=COLOR_DANGER,
+                            on_press=self.delete_todo,
+                            user_data=todo
                         )
                     ],
-                    elevation="sm",
-                    padding=12,
-                    margin=(12, 0)
-                ),
-                
-                Divider(),
-                
+                    spacing=12
+                )
+            ],
+            elevation="sm",
+            padding=16,
+            margin=(8, 0)
+        )
+
+    def body(self):
+        # Read the rebuild trigger so dependency tracking picks it up
+        _ = self.refresh.value
+
+        visible_todos = self.get_visible_todos()
+
+        # Refresh only the varying part of the pre-built header
+        self._header_stats_label.text = self._stats_text()
+
+        # Build todo item cards (memoized per item)
+        todo_cards = []
+        for todo in visible_todos:
+            memo = self._todo_memos.get(todo)
+            if memo is None:
+                memo = self._todo_memos[todo] = Memo(
+                    lambda t=todo: self._build_todo_card(t)
+                )
+            todo_cards.append(memo())
+
+        return VBox(
+            children=[
+                # Pre-composed panels (built once in __init__)
+                self._header_card,
+                self._add_card,
+                self._filter_card,
+                self._divider,
+
                 # Todo list
                 *todo_cards,
-                
+
                 # Empty state
                 Label(
                     text="No todos to show" if not visible_todos else "",
                     font_size=16,
-                    color="#8E8E93"
+                    color=COLOR_GRAY
                 ) if not visible_todos else Spacer(),
-                
+
                 # Footer
-                Label(
-                    text="Built with PocketPy Framework",
-                    font_size=12,
-                    color="#8E8E93"
-                )
+                self._footer
             ],
             spacing=12,
             padding=16
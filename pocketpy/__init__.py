@@ -1,73 +1,88 @@
 """
 PocketPy - A modern Python mobile framework with beautiful UI components
+
+Submodules are imported lazily (PEP 562): ``import pocketpy`` only pays
+for the modules an app actually touches instead of the whole widget tree.
 """
 
+import importlib
+
 __version__ = "0.2.0"
 __author__ = "PocketPy Team"
 __email__ = "team@pocketpy.dev"
 
-# Core components
-from pocketpy.core.app import App, View
-from pocketpy.core.state import State
-from pocketpy.core.theme import Theme, ColorScheme, Typography, Spacing, Shadows
-from pocketpy.core.animation import AnimationController, Easing, Transition
-from pocketpy.core.gestures import GestureRecognizer, GestureEvent, GestureType, SwipeDirection
-from pocketpy.core.navigator import Navigator, Route, NavigationBar
+# Maps public names to the submodule that defines them; resolved on first
+# attribute access and cached in globals() so later lookups are free.
+_ATTR_MAP = {
+    # Core
+    "App": "pocketpy.core.app",
+    "View": "pocketpy.core.app",
+    "State": "pocketpy.core.state",
+    "Memo": "pocketpy.core.state",
+    "batch": "pocketpy.core.state",
+    "Theme": "pocketpy.core.theme",
+    "ColorScheme": "pocketpy.core.theme",
+    "Typography": "pocketpy.core.theme",
+    "Spacing": "pocketpy.core.theme",
+    "Shadows": "pocketpy.core.theme",
+    "AnimationController": "pocketpy.core.animation",
+    "Easing": "pocketpy.core.animation",
+    "Transition": "pocketpy.core.animation",
+    "GestureRecognizer": "pocketpy.core.gestures",
+    "GestureEvent": "pocketpy.core.gestures",
+    "GestureType": "pocketpy.core.gestures",
+    "SwipeDirection": "pocketpy.core.gestures",
+    "Navigator": "pocketpy.core.navigator",
+    "Route": "pocketpy.core.navigator",
+    "NavigationBar": "pocketpy.core.navigator",
 
-# Base widget
-from pocketpy.widgets.base import Widget
+    # Widgets
+    "Widget": "pocketpy.widgets.base",
+    "Label": "pocketpy.widgets.label",
+    "Button": "pocketpy.widgets.button",
+    "TextInput": "pocketpy.widgets.textinput",
+    "Image": "pocketpy.widgets.image",
+    "Switch": "pocketpy.widgets.switch",
+    "Slider": "pocketpy.widgets.slider",
+    "Card": "pocketpy.widgets.card",
 
-# Basic widgets
-from pocketpy.widgets.label import Label
-from pocketpy.widgets.button import Button
-from pocketpy.widgets.textinput import TextInput
-from pocketpy.widgets.image import Image
-from pocketpy.widgets.switch import Switch
-from pocketpy.widgets.slider import Slider
-from pocketpy.widgets.card import Card
+    # Layouts
+    "VBox": "pocketpy.layout.vbox",
+    "HBox": "pocketpy.layout.hbox",
+    "Grid": "pocketpy.layout.advanced",
+    "Stack": "pocketpy.layout.advanced",
+    "Spacer": "pocketpy.layout.advanced",
+    "Divider": "pocketpy.layout.advanced",
+    "ScrollView": "pocketpy.layout.advanced",
+}
 
-# Layout widgets
-from pocketpy.layout.vbox import VBox
-from pocketpy.layout.hbox import HBox
-from pocketpy.layout.advanced import Grid, Stack, Spacer, Divider, ScrollView
+__all__ = list(_ATTR_MAP)
 
-__all__ = [
-    # Core
-    "App",
-    "View",
-    "State",
-    "Theme",
-    "ColorScheme",
-    "Typography",
-    "Spacing",
-    "Shadows",
-    "AnimationController",
-    "Easing",
-    "Transition",
-    "GestureRecognizer",
-    "GestureEvent",
-    "GestureType",
-    "SwipeDirection",
-    "Navigator",
-    "Route",
-    "NavigationBar",
-    
-    # Widgets
-    "Widget",
-    "Label",
-    "Button",
-    "TextInput",
-    "Image",
-    "Switch",
-    "Slider",
-    "Card",
-    
-    # Layouts
-    "VBox",
-    "HBox",
-    "Grid",
-    "Stack",
-    "Spacer",
-    "Divider",
-    "ScrollView",
-]
+
+def __getattr__(name: str):
+    """
+    Resolve a public name lazily on first access (PEP 562).
+
+    Args:
+        name: Attribute name being looked up on the package
+
+    Returns:
+        The resolved class or function
+
+    Raises:
+        AttributeError: If the name is not part of the public API
+    """
+    try:
+        module_name = _ATTR_MAP[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Expose lazy attributes to dir() and tooling."""
+    return sorted(set(globals()) | set(_ATTR_MAP))
@@ -2,9 +2,118 @@
 Pygame rendering backend for PocketPy framework
 """
 
+import sys
+
 import pygame
+from collections import OrderedDict
 from typing import Any, Dict, Optional, Tuple
 
+from pocketpy.core.state import batch
+
+# Above this many dirty rects, one full flip beats many partial updates
+MAX_DIRTY_RECTS = 25
+
+# Guarantee interning of the dict keys hit on every draw iteration so
+# their lookups resolve by pointer equality; CPython interns most
+# identifier-like literals, this makes the fast path a contract
+for _key in (
+    'type', 'position', 'text', 'font_size', 'font_family', 'color',
+    'background_color', 'padding', 'disabled', 'on_press', 'children',
+    'width', 'height', 'value', 'percentage', 'placeholder', '_bounds',
+    '_rect', 'on_drag', 'border_radius', 'elevation', 'orientation',
+    'thickness', 'length',
+):
+    sys.intern(_key)
+del _key
+
+
+def _hit_scan(x: int, y: int, edges: list, widgets: list) -> Optional[Dict[str, Any]]:
+    """
+    Scan a flat edge buffer for the top-most widget containing a point.
+
+    The buffer is in draw order, so the last hit is the one painted on
+    top. Edges are precomputed at collection time, leaving the inner
+    loop with four comparisons and no arithmetic.
+
+    Args:
+        x: Point x coordinate
+        y: Point y coordinate
+        edges: List of (x1, y1, x2, y2) tuples in draw order
+        widgets: Parallel list of widget data dictionaries
+
+    Returns:
+        The hit widget's data dictionary, or None
+    """
+    for i in range(len(edges) - 1, -1, -1):
+        x1, y1, x2, y2 = edges[i]
+        if x1 <= x <= x2 and y1 <= y <= y2:
+            return widgets[i]
+    return None
+
+
+def _tree_signature(data: Dict[str, Any]) -> tuple:
+    """
+    Freeze a widget dict tree into a comparable tuple.
+
+    Callbacks and derived bounds are skipped so the signature only
+    changes when something visual does.
+
+    Args:
+        data: Widget data dictionary from build()
+
+    Returns:
+        Nested tuple capturing the tree's visual state
+    """
+    items = []
+    for key in sorted(data):
+        # 'child' is ScrollView's single nested build dict; like
+        # 'children' it is recursed into below, not kept as a raw
+        # (unhashable) dict value
+        if key in ('children', 'child', '_bounds', '_rect'):
+            continue
+        value = data[key]
+        if callable(value):
+            continue
+        items.append((key, value))
+    children = data.get('children')
+    child_sigs = [_tree_signature(c) for c in children] if children else []
+    child = data.get('child')
+    if child:
+        child_sigs.append(_tree_signature(child))
+    return (tuple(items), tuple(child_sigs))
+
+
+def _adopt_drawn_state(drawn: Dict[str, Any], current: Dict[str, Any],
+                       paired: Dict[int, Dict[str, Any]]) -> None:
+    """
+    Pair a previously drawn tree's dicts with a visually identical one.
+
+    A matching signature guarantees both trees have the same shape and
+    geometry, so they are walked in lockstep: each current dict inherits
+    the _bounds/_rect written when the drawn frame was composed, and
+    ``paired`` maps the drawn dicts (by identity) to their current
+    counterparts so hit buffers can be rebuilt against live handlers.
+
+    Args:
+        drawn: Widget dict from the frame that was drawn and cached
+        current: The corresponding dict from the tree being shown now
+        paired: Output map from id(drawn dict) to current dict
+    """
+    bounds = drawn.get('_bounds')
+    if bounds is not None:
+        current['_bounds'] = bounds
+    rect = drawn.get('_rect')
+    if rect is not None:
+        current['_rect'] = rect
+    paired[id(drawn)] = current
+    children = drawn.get('children')
+    if children:
+        for drawn_child, current_child in zip(children, current['children']):
+            _adopt_drawn_state(drawn_child, current_child, paired)
+    child = drawn.get('child')
+    if child:
+        _adopt_drawn_state(child, current['child'], paired)
+
 
 class PygameBackend:
     """
@@ -37,9 +146,68 @@ class PygameBackend:
         self.clock = pygame.time.Clock()
         self.fps = 60
         
-        # Font cache
-        self.font_cache: Dict[Tuple[str, int], pygame.font.Font] = {}
-        
+        # Font cache, prefilled for the default family at the sizes the
+        # widget set actually uses so no frame pays the creation cost
+        self._sans_key = sys.intern('sans-serif')
+        self.font_cache: Dict[Tuple[str, int], pygame.font.Font] = {
+            (self._sans_key, size): pygame.font.Font(None, size)
+            for size in (12, 14, 16, 18, 24, 32)
+        }
+
+        # Rendered text surface cache (LRU, bounded)
+        self.text_cache: OrderedDict[Tuple, pygame.Surface] = OrderedDict()
+        self.text_cache_size = 512
+
+        # Parsed color cache, seeded with the defaults used across the
+        # widget set so the first frame already hits
+        self._color_cache: Dict[str, Tuple[int, int, int]] = {
+            '#000000': (0, 0, 0),
+            '#FFFFFF': (255, 255, 255),
+            '#007AFF': (0, 122, 255),
+            '#34C759': (52, 199, 89),
+            '#C6C6C8': (198, 198, 200),
+            '#8E8E93': (142, 142, 147),
+            '#E5E5EA': (229, 229, 234),
+        }
+
+        # Pre-rendered button backdrops (shadow + rounded background +
+        # border), keyed by size/color/disabled and blitted per frame
+        self._button_bg_cache: OrderedDict[Tuple, pygame.Surface] = OrderedDict()
+        self._button_bg_cache_size = 128
+
+        # Derived color variants (border/disabled shades), computed once
+        # per base color instead of per frame
+        self._variant_cache: Dict[Tuple[Tuple[int, int, int], str],
+                                  Tuple[int, int, int]] = {}
+
+        # Previous frame's widget tree, for dirty-rect diffing and hit
+        # testing (it carries the _bounds written during drawing)
+        self._prev_tree: Optional[Dict[str, Any]] = None
+
+        # Signature of the last drawn tree; identical frames skip drawing
+        self._prev_sig: Optional[tuple] = None
+
+        # Flat hit-test buffer (precomputed rect edges and widget dicts
+        # in draw order), rebuilt on every draw
+        self._hit_edges: list = []
+        self._hit_widgets: list = []
+
+        # Text surfaces queued during the draw walk and issued as one
+        # batched blit call at the end of the frame
+        self._pending_blits: list = []
+
+        # Pre-rendered switch/slider surfaces keyed by their full
+        # visual state; a cache hit turns 3-5 draw primitives into one
+        # queued blit
+        self._widget_surf_cache: OrderedDict[Tuple, pygame.Surface] = OrderedDict()
+        self._widget_surf_cache_size = 256
+
+        # Recently composed frames keyed by tree signature. Re-showing a
+        # frame the user has toggled back to replays one full-screen blit
+        # instead of rasterizing the whole tree again.
+        self._frame_cache: OrderedDict[tuple, tuple] = OrderedDict()
+        self._frame_cache_size = 4
+
         # Running state
         self.running = False
     
@@ -71,48 +239,101 @@ class PygameBackend:
         """
         if not color_str:
             return (255, 255, 255)
-        
-        # Remove # prefix
-        color_str = color_str.lstrip('#')
-        
-        # Parse hex
+
+        # Fast path: every widget calls this 1-4 times per frame with a
+        # handful of recurring strings
+        cache = self._color_cache
+        color = cache.get(color_str)
+        if color is not None:
+            return color
+
+        # Single-shot parse with bit extraction
         try:
-            r = int(color_str[0:2], 16)
-            g = int(color_str[2:4], 16)
-            b = int(color_str[4:6], 16)
-            return (r, g, b)
+            value = int(color_str[1:] if color_str[0] == '#' else color_str, 16)
+            color = ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
         except (ValueError, IndexError):
-            return (255, 255, 255)
+            color = (255, 255, 255)
+
+        if len(cache) < 512:
+            cache[color_str] = color
+        return color
     
-    def draw_widget(self, widget_data: Dict[str, Any], surface: pygame.Surface) -> None:
+    def _color_variant(self, color: Tuple[int, int, int],
+                       kind: str) -> Tuple[int, int, int]:
+        """
+        Get a cached shade variant of a base color.
+
+        Args:
+            color: Base RGB tuple
+            kind: 'border' (darker) or 'disabled' (lighter)
+
+        Returns:
+            Shaded RGB tuple
+        """
+        key = (color, kind)
+        variant = self._variant_cache.get(key)
+        if variant is None:
+            if kind == 'border':
+                variant = tuple(max(c - 30, 0) for c in color)
+            else:
+                variant = tuple(min(c + 50, 255) for c in color)
+            self._variant_cache[key] = variant
+        return variant
+
+    def _store_widget_surface(self, key: Tuple, surf: pygame.Surface) -> None:
+        """
+        Insert a pre-rendered widget surface, evicting oldest first.
+
+        Args:
+            key: Visual-state cache key
+            surf: The composed surface
+        """
+        cache = self._widget_surf_cache
+        cache[key] = surf
+        if len(cache) > self._widget_surf_cache_size:
+            cache.popitem(last=False)
+
+    def draw_widget(self, widget_data: Dict[str, Any], surface: pygame.Surface,
+                    offset: Tuple[int, int] = (0, 0)) -> None:
         """
         Draw a single widget based on its data dictionary.
         
         Args:
             widget_data: Widget description dictionary from build()
             surface: Pygame surface to draw on
+            offset: (dx, dy) added to the widget's declared position,
+                used by containers to place children without mutating
+                their build dictionaries
         """
-        widget_type = widget_data.get('type')
-        
-        # Draw based on widget type
-        if widget_type == 'label':
-            self.draw_label(widget_data, surface)
-        elif widget_type == 'button':
-            self.draw_button(widget_data, surface)
-        elif widget_type in ('vbox', 'hbox', 'grid', 'stack'):
-            self.draw_layout(widget_data, surface)
-        elif widget_type == 'textinput':
-            self.draw_textinput(widget_data, surface)
-        elif widget_type == 'switch':
-            self.draw_switch(widget_data, surface)
-        elif widget_type == 'slider':
-            self.draw_slider(widget_data, surface)
-        elif widget_type == 'card':
-            self.draw_card(widget_data, surface)
-        elif widget_type == 'divider':
-            self.draw_divider(widget_data, surface)
+        # Clip wholly offscreen subtrees before any draw work. Layouts
+        # place children below and to the right of their own origin, so
+        # an origin past the right/bottom edge rules out the whole
+        # subtree; the left/top check needs an explicit size.
+        x, y = widget_data.get('position', (0, 0))
+        x += offset[0]
+        y += offset[1]
+        if x >= self.width or y >= self.height:
+            return
+        width = widget_data.get('width')
+        height = widget_data.get('height')
+        if width and height and (x + width <= 0 or y + height <= 0):
+            return
+
+        # Single dict lookup instead of a string-comparison chain
+        fn = self._DISPATCH.get(widget_data.get('type'))
+        if fn is not None:
+            fn(self, widget_data, surface, offset)
+
+        # Interactive widgets record _bounds while drawing; collect them
+        # into the flat hit-test buffer in draw order
+        bounds = widget_data.get('_bounds')
+        if bounds is not None:
+            bx, by, bw, bh = bounds
+            self._hit_edges.append((bx, by, bx + bw, by + bh))
+            self._hit_widgets.append(widget_data)
     
-    def draw_label(self, data: Dict[str, Any], surface: pygame.Surface) -> None:
+    def draw_label(self, data: Dict[str, Any], surface: pygame.Surface,
+                   offset: Tuple[int, int] = (0, 0)) -> None:
         """
         Draw a label widget.
         
@@ -121,21 +342,63 @@ class PygameBackend:
             surface: Pygame surface to draw on
         """
         x, y = data.get('position', (0, 0))
+        x += offset[0]
+        y += offset[1]
         text = data.get('text', '')
         font_size = data.get('font_size', 24)
-        font_family = data.get('font_family', 'sans-serif')
+        font_family = data.get('font_family', self._sans_key)
         color = self.parse_color(data.get('color', '#000000'))
-        
-        # Get font
+        antialias = data.get('antialias', True)
+
+        # Re-use a cached surface; rasterizing is the most expensive op here
+        text_surface = self.render_text(str(text), font_family, font_size,
+                                        color, antialias)
+
+        # Record the painted area for dirty-rect diffing (labels have no
+        # interactive bounds, so this lives under a separate key)
+        data['_rect'] = (x, y, *text_surface.get_size())
+
+        # Queue text for the end-of-frame batched blit
+        self._pending_blits.append((text_surface, (x, y)))
+
+    def render_text(self, text: str, font_family: str, font_size: int,
+                    color: Tuple[int, int, int],
+                    antialias: bool = True) -> pygame.Surface:
+        """
+        Render text to a surface, caching the result.
+
+        Rasterization through ``Font.render`` dominates frame time, so
+        identical (text, font, size, color) combinations are rendered once
+        and served from a bounded LRU cache afterwards.
+
+        Args:
+            text: The text to render
+            font_family: Font family name
+            font_size: Font size in points
+            color: RGB color tuple
+            antialias: Whether to antialias; non-AA rasterization is
+                markedly cheaper for small, frequently changing text
+
+        Returns:
+            Rendered (possibly cached) text surface
+        """
+        key = (text, font_family, font_size, color, antialias)
+        cache = self.text_cache
+        text_surface = cache.get(key)
+        if text_surface is not None:
+            cache.move_to_end(key)
+            return text_surface
+
         font = self.get_font(font_family, font_size)
-        
-        # Render text with antialiasing
-        text_surface = font.render(str(text), True, color)
-        
-        # Draw text
-        surface.blit(text_surface, (x, y))
+        text_surface = font.render(text, antialias, color)
+
+        cache[key] = text_surface
+        if len(cache) > self.text_cache_size:
+            cache.popitem(last=False)
+        return text_surface
     
-    def draw_button(self, data: Dict[str, Any], surface: pygame.Surface) -> None:
+    def draw_button(self, data: Dict[str, Any], surface: pygame.Surface,
+                    offset: Tuple[int, int] = (0, 0)) -> None:
         """
         Draw a button widget.
         
@@ -143,11 +406,14 @@ class PygameBackend:
             data: Button widget data
             surface: Pygame surface
         """
-        text = str(data.get('text', ''))
-        x, y = data.get('position', (0, 0))
-        
+        get = data.get  # hoist the bound method for the lookup burst below
+        text = str(get('text', ''))
+        x, y = get('position', (0, 0))
+        x += offset[0]
+        y += offset[1]
+
         # Get padding
-        padding = data.get('padding', (10, 20))
+        padding = get('padding', (10, 20))
         if isinstance(padding, tuple):
             pad_v = padding[0] if len(padding) > 0 else 10
             pad_h = padding[1] if len(padding) > 1 else pad_v
@@ -155,15 +421,13 @@ class PygameBackend:
             pad_v = pad_h = padding
         
         # Get colors
-        bg_color = self.parse_color(data.get('background_color', '#007AFF'))
-        text_color = self.parse_color(data.get('color', '#FFFFFF'))
-        
-        # Get font
-        font_size = data.get('font_size', 14)
-        font = self.get_font('sans-serif', font_size)
-        
-        # Render text to get size
-        text_surface = font.render(text, True, text_color)
+        bg_color = self.parse_color(get('background_color', '#007AFF'))
+        text_color = self.parse_color(get('color', '#FFFFFF'))
+
+        # Render (cached) text to get size
+        font_size = get('font_size', 14)
+        text_surface = self.render_text(text, self._sans_key, font_size,
+                                        text_color, get('antialias', True))
         text_width, text_height = text_surface.get_size()
         
         # Calculate button size
@@ -173,30 +437,61 @@ class PygameBackend:
         # Store bounds for hit testing (we'll add this to the data)
         data['_bounds'] = (x, y, button_width, button_height)
         
-        # Draw shadow for depth
-        shadow_offset = 2
-        shadow_rect = pygame.Rect(x + shadow_offset, y + shadow_offset, button_width, button_height)
-        pygame.draw.rect(surface, (150, 150, 150), shadow_rect, border_radius=8)
-        
-        # Draw button background with rounded corners
-        button_rect = pygame.Rect(x, y, button_width, button_height)
-        if not data.get('disabled', False):
-            pygame.draw.rect(surface, bg_color, button_rect, border_radius=8)
-        else:
-            # Lighter color for disabled
-            disabled_color = tuple(min(c + 50, 255) for c in bg_color)
-            pygame.draw.rect(surface, disabled_color, button_rect, border_radius=8)
-        
-        # Draw button border
-        border_color = tuple(max(c - 30, 0) for c in bg_color)
-        pygame.draw.rect(surface, border_color, button_rect, 2, border_radius=8)
+        # Blit a pre-rendered backdrop; rounded-rect rasterization with
+        # anti-aliased corners is the expensive part of a button
+        disabled = get('disabled', False)
+        backdrop = self._button_backdrop(button_width, button_height,
+                                         bg_color, disabled)
+        self._pending_blits.append((backdrop, (x, y)))
         
-        # Draw text centered
+        # Queue centered text for the end-of-frame batched blit
         text_x = x + pad_h
         text_y = y + pad_v
-        surface.blit(text_surface, (text_x, text_y))
+        self._pending_blits.append((text_surface, (text_x, text_y)))
     
-    def draw_layout(self, data: Dict[str, Any], surface: pygame.Surface) -> None:
+    def _button_backdrop(self, width: int, height: int,
+                         bg_color: Tuple[int, int, int],
+                         disabled: bool) -> pygame.Surface:
+        """
+        Get a cached surface with a button's shadow, background and border.
+
+        Args:
+            width: Button width in pixels
+            height: Button height in pixels
+            bg_color: Background RGB tuple
+            disabled: Whether to render the disabled shade
+
+        Returns:
+            Surface ready to blit at the button's origin
+        """
+        key = (width, height, bg_color, disabled)
+        cache = self._button_bg_cache
+        backdrop = cache.get(key)
+        if backdrop is not None:
+            return backdrop
+
+        backdrop = pygame.Surface((width + 2, height + 2), pygame.SRCALPHA)
+        body_rect = (0, 0, width, height)
+
+        # Shadow for depth, offset behind the body
+        pygame.draw.rect(backdrop, (150, 150, 150), (2, 2, width, height),
+                         border_radius=8)
+
+        # Background with rounded corners (lighter when disabled)
+        fill = self._color_variant(bg_color, 'disabled') if disabled else bg_color
+        pygame.draw.rect(backdrop, fill, body_rect, border_radius=8)
+
+        # Border
+        pygame.draw.rect(backdrop, self._color_variant(bg_color, 'border'),
+                         body_rect, 2, border_radius=8)
+
+        cache[key] = backdrop
+        if len(cache) > self._button_bg_cache_size:
+            cache.popitem(last=False)
+        return backdrop
+
+    def draw_layout(self, data: Dict[str, Any], surface: pygame.Surface,
+                    offset: Tuple[int, int] = (0, 0)) -> None:
         """
         Draw a layout container (VBox or HBox).
         
@@ -206,6 +501,8 @@ class PygameBackend:
         """
         # Draw background if specified
         x, y = data.get('position', (0, 0))
+        x += offset[0]
+        y += offset[1]
         width = data.get('width')
         height = data.get('height')
         bg_color = data.get('background_color')
@@ -223,22 +520,26 @@ class PygameBackend:
         # Draw all children
         children = data.get('children', [])
         for child in children:
-            self.draw_widget(child, surface)
+            self.draw_widget(child, surface, offset)
     
-    def draw_textinput(self, data: Dict[str, Any], surface: pygame.Surface) -> None:
+    def draw_textinput(self, data: Dict[str, Any], surface: pygame.Surface,
+                       offset: Tuple[int, int] = (0, 0)) -> None:
         """Draw text input widget"""
-        x, y = data.get('position', (0, 0))
-        width = data.get('width', 200)
-        height = data.get('height', 40)
-        text = data.get('text', '')
-        placeholder = data.get('placeholder', '')
-        bg_color = self.parse_color(data.get('background_color', '#FFFFFF'))
-        border_color = self.parse_color(data.get('border_color', '#C6C6C8'))
-        text_color = self.parse_color(data.get('color', '#000000'))
-        placeholder_color = self.parse_color(data.get('placeholder_color', '#8E8E93'))
-        font_size = data.get('font_size', 16)
-        is_focused = data.get('is_focused', False)
-        padding = data.get('padding', (8, 12))
+        get = data.get  # hoist the bound method for the lookup burst below
+        x, y = get('position', (0, 0))
+        x += offset[0]
+        y += offset[1]
+        width = get('width', 200)
+        height = get('height', 40)
+        text = get('text', '')
+        placeholder = get('placeholder', '')
+        bg_color = self.parse_color(get('background_color', '#FFFFFF'))
+        border_color = self.parse_color(get('border_color', '#C6C6C8'))
+        text_color = self.parse_color(get('color', '#000000'))
+        placeholder_color = self.parse_color(get('placeholder_color', '#8E8E93'))
+        font_size = get('font_size', 16)
+        is_focused = get('is_focused', False)
+        padding = get('padding', (8, 12))
         pad_v, pad_h = padding if isinstance(padding, tuple) else (padding, padding)
         
         # Draw background
@@ -249,22 +550,25 @@ class PygameBackend:
         pygame.draw.rect(surface, border_color, (x, y, width, height), border_width, border_radius=8)
         
         # Draw text or placeholder
-        font = self.get_font('sans-serif', font_size)
         display_text = text if text else placeholder
         color = text_color if text else placeholder_color
-        
+
         if display_text:
-            text_surface = font.render(display_text, True, color)
+            text_surface = self.render_text(display_text, self._sans_key,
+                                            font_size, color)
             text_x = x + pad_h
             text_y = y + (height - text_surface.get_height()) // 2
-            surface.blit(text_surface, (text_x, text_y))
+            self._pending_blits.append((text_surface, (text_x, text_y)))
         
         # Store bounds
         data['_bounds'] = (x, y, width, height)
     
-    def draw_switch(self, data: Dict[str, Any], surface: pygame.Surface) -> None:
+    def draw_switch(self, data: Dict[str, Any], surface: pygame.Surface,
+                    offset: Tuple[int, int] = (0, 0)) -> None:
         """Draw switch toggle widget"""
         x, y = data.get('position', (0, 0))
+        x += offset[0]
+        y += offset[1]
         width = data.get('width', 51)
         height = data.get('height', 31)
         value = data.get('value', False)
@@ -276,27 +580,39 @@ class PygameBackend:
         # Background
         bg_color = on_color if value else off_color
         if disabled:
-            bg_color = tuple(min(c + 50, 255) for c in bg_color)
-        
-        pygame.draw.rect(surface, bg_color, (x, y, width, height), border_radius=height//2)
-        
-        # Thumb position
-        thumb_radius = (height - 4) // 2
-        thumb_x = x + width - thumb_radius - 2 if value else x + thumb_radius + 2
-        thumb_y = y + height // 2
-        
-        # Draw thumb shadow
-        pygame.draw.circle(surface, (0, 0, 0, 30), (thumb_x + 1, thumb_y + 1), thumb_radius)
-        
-        # Draw thumb
-        pygame.draw.circle(surface, thumb_color, (thumb_x, thumb_y), thumb_radius)
-        
+            bg_color = self._color_variant(bg_color, 'disabled')
+
+        # Compose once per visual state, then re-blit the cached surface
+        key = ('switch', width, height, bool(value), bg_color, thumb_color)
+        cached = self._widget_surf_cache.get(key)
+        if cached is None:
+            cached = pygame.Surface((width + 1, height + 1), pygame.SRCALPHA)
+            pygame.draw.rect(cached, bg_color, (0, 0, width, height),
+                             border_radius=height // 2)
+
+            # Thumb position (local coordinates)
+            thumb_radius = (height - 4) // 2
+            thumb_x = width - thumb_radius - 2 if value else thumb_radius + 2
+            thumb_y = height // 2
+
+            # Thumb shadow, then thumb
+            pygame.draw.circle(cached, (0, 0, 0, 30),
+                               (thumb_x + 1, thumb_y + 1), thumb_radius)
+            pygame.draw.circle(cached, thumb_color,
+                               (thumb_x, thumb_y), thumb_radius)
+            self._store_widget_surface(key, cached)
+
+        self._pending_blits.append((cached, (x, y)))
+
         # Store bounds
         data['_bounds'] = (x, y, width, height)
     
-    def draw_slider(self, data: Dict[str, Any], surface: pygame.Surface) -> None:
+    def draw_slider(self, data: Dict[str, Any], surface: pygame.Surface,
+                    offset: Tuple[int, int] = (0, 0)) -> None:
         """Draw slider widget"""
         x, y = data.get('position', (0, 0))
+        x += offset[0]
+        y += offset[1]
         width = data.get('width', 200)
         height = data.get('height', 4)
         percentage = data.get('percentage', 0.5)
@@ -304,34 +620,51 @@ class PygameBackend:
         active_color = self.parse_color(data.get('active_color', '#007AFF'))
         thumb_color = self.parse_color(data.get('thumb_color', '#FFFFFF'))
         
-        track_y = y + 10
-        
-        # Draw track
-        pygame.draw.rect(surface, track_color, (x, track_y, width, height), border_radius=2)
-        
-        # Draw active portion
+        # The thumb can overhang the track by its radius on either side,
+        # so the cached surface carries an 11px horizontal margin
+        margin = 11
         active_width = int(width * percentage)
-        if active_width > 0:
-            pygame.draw.rect(surface, active_color, (x, track_y, active_width, height), border_radius=2)
-        
-        # Draw thumb
-        thumb_x = x + active_width
-        thumb_y = track_y + height // 2
-        thumb_radius = 10
-        
-        # Thumb shadow
-        pygame.draw.circle(surface, (0, 0, 0, 50), (thumb_x + 1, thumb_y + 1), thumb_radius)
-        
-        # Thumb
-        pygame.draw.circle(surface, thumb_color, (thumb_x, thumb_y), thumb_radius)
-        pygame.draw.circle(surface, active_color, (thumb_x, thumb_y), thumb_radius - 2)
-        
+
+        # Bucketed by pixel position of the thumb, so a given size/color
+        # combination caches at most width+1 surfaces while dragging
+        key = ('slider', width, height, active_width,
+               track_color, active_color, thumb_color)
+        cached = self._widget_surf_cache.get(key)
+        if cached is None:
+            cached = pygame.Surface((width + 2 * margin, 32), pygame.SRCALPHA)
+            track_y = 10
+
+            # Track, then active portion (local coordinates)
+            pygame.draw.rect(cached, track_color,
+                             (margin, track_y, width, height), border_radius=2)
+            if active_width > 0:
+                pygame.draw.rect(cached, active_color,
+                                 (margin, track_y, active_width, height),
+                                 border_radius=2)
+
+            # Thumb shadow, thumb, inner dot
+            thumb_x = margin + active_width
+            thumb_y = track_y + height // 2
+            thumb_radius = 10
+            pygame.draw.circle(cached, (0, 0, 0, 50),
+                               (thumb_x + 1, thumb_y + 1), thumb_radius)
+            pygame.draw.circle(cached, thumb_color,
+                               (thumb_x, thumb_y), thumb_radius)
+            pygame.draw.circle(cached, active_color,
+                               (thumb_x, thumb_y), thumb_radius - 2)
+            self._store_widget_surface(key, cached)
+
+        self._pending_blits.append((cached, (x - margin, y)))
+
         # Store bounds
         data['_bounds'] = (x, y - 10, width, 30)
     
-    def draw_card(self, data: Dict[str, Any], surface: pygame.Surface) -> None:
+    def draw_card(self, data: Dict[str, Any], surface: pygame.Surface,
+                  offset: Tuple[int, int] = (0, 0)) -> None:
         """Draw card widget"""
         x, y = data.get('position', (0, 0))
+        x += offset[0]
+        y += offset[1]
         width = data.get('width') or 300
         height = data.get('height') or 200
         bg_color = self.parse_color(data.get('background_color', '#FFFFFF'))
@@ -343,8 +676,10 @@ class PygameBackend:
         shadow_offset = shadow_offsets.get(elevation, 4)
         
         if shadow_offset > 0:
-            shadow_rect = pygame.Rect(int(x + shadow_offset), int(y + shadow_offset), int(width), int(height))
-            pygame.draw.rect(surface, (150, 150, 150), shadow_rect, border_radius=border_radius)
+            pygame.draw.rect(surface, (150, 150, 150),
+                             (int(x + shadow_offset), int(y + shadow_offset),
+                              int(width), int(height)),
+                             border_radius=border_radius)
         
         # Draw card
         pygame.draw.rect(surface, bg_color, (x, y, width, height), border_radius=border_radius)
@@ -361,15 +696,18 @@ class PygameBackend:
         pad = padding if isinstance(padding, int) else padding[0]
         
         for child in children:
-            # Offset children by padding
-            if 'position' in child:
-                child_x, child_y = child['position']
-                child['position'] = (x + pad, y + pad)
-            self.draw_widget(child, surface)
+            # Place children at the padded origin via a draw-time offset
+            # instead of rewriting their build dicts every frame
+            child_x, child_y = child.get('position', (0, 0))
+            self.draw_widget(child, surface,
+                             (x + pad - child_x, y + pad - child_y))
     
-    def draw_divider(self, data: Dict[str, Any], surface: pygame.Surface) -> None:
+    def draw_divider(self, data: Dict[str, Any], surface: pygame.Surface,
+                     offset: Tuple[int, int] = (0, 0)) -> None:
         """Draw divider line"""
         x, y = data.get('position', (0, 0))
+        x += offset[0]
+        y += offset[1]
         orientation = data.get('orientation', 'horizontal')
         thickness = data.get('thickness', 1)
         color = self.parse_color(data.get('color', '#E5E5EA'))
@@ -379,22 +717,178 @@ class PygameBackend:
             pygame.draw.rect(surface, color, (x, y, length, thickness))
         else:
             pygame.draw.rect(surface, color, (x, y, thickness, length))
-    
-    def draw(self, root_widget_data: Dict[str, Any]) -> None:
+
+    # Widget type -> unbound draw method, resolved once at class creation
+    _DISPATCH = {
+        'label': draw_label,
+        'button': draw_button,
+        'vbox': draw_layout,
+        'hbox': draw_layout,
+        'grid': draw_layout,
+        'stack': draw_layout,
+        'textinput': draw_textinput,
+        'switch': draw_switch,
+        'slider': draw_slider,
+        'card': draw_card,
+        'divider': draw_divider,
+    }
+
+    def _widget_rect(self, data: Dict[str, Any]) -> Optional[pygame.Rect]:
         """
-        Draw the entire widget tree.
-        
+        Best-known screen rect for a drawn widget, or None.
+
+        Args:
+            data: Widget data dictionary (after drawing)
+
+        Returns:
+            Rect covering the widget, or None if its size is unknown
+        """
+        bounds = data.get('_rect') or data.get('_bounds')
+        if bounds:
+            return pygame.Rect(*bounds)
+        width = data.get('width')
+        height = data.get('height')
+        if width and height:
+            x, y = data.get('position', (0, 0))
+            return pygame.Rect(x, y, width, height)
+        return None
+
+    def _collect_dirty_rects(self, old: Dict[str, Any], new: Dict[str, Any],
+                             rects: list) -> bool:
+        """
+        Diff two drawn widget trees, collecting rects of changed widgets.
+
+        Args:
+            old: Previous frame's widget data
+            new: Current frame's widget data
+            rects: Output list of pygame.Rect to update
+
+        Returns:
+            False if the change cannot be localized (structure changed or
+            a changed widget's size is unknown) and a full flip is needed
+        """
+        if old.get('type') != new.get('type'):
+            return False
+
+        old_children = old.get('children', [])
+        new_children = new.get('children', [])
+        if len(old_children) != len(new_children):
+            return False
+
+        # Compare this widget's own visual fields. Callbacks are rebound
+        # on every rebuild and bounds are derived, so both are skipped.
+        changed = False
+        for key in new.keys() | old.keys():
+            if key in ('children', '_bounds', '_rect'):
+                continue
+            old_value = old.get(key)
+            new_value = new.get(key)
+            if callable(old_value) and callable(new_value):
+                continue
+            if old_value != new_value:
+                changed = True
+                break
+
+        if not changed:
+            # Config is identical, but the widget may still have been
+            # drawn somewhere else (interactive widgets get repositioned
+            # by their parents during drawing); compare last frame's
+            # recorded footprint with this frame's
+            old_fp = old.get('_rect') or old.get('_bounds')
+            new_fp = new.get('_rect') or new.get('_bounds')
+            changed = old_fp != new_fp
+
+        if changed:
+            old_rect = self._widget_rect(old)
+            new_rect = self._widget_rect(new)
+            if old_rect is None or new_rect is None:
+                return False
+            rects.append(old_rect.union(new_rect))
+
+        for old_child, new_child in zip(old_children, new_children):
+            if not self._collect_dirty_rects(old_child, new_child, rects):
+                return False
+        return True
+
+    def draw(self, root_widget_data: Dict[str, Any],
+             sig: Optional[tuple] = None) -> None:
+        """
+        Draw the entire widget tree, presenting only changed regions.
+
+        The tree is drawn into the back buffer, then diffed against the
+        previous frame's tree: when all changes can be localized, only
+        their rects are presented via pygame.display.update; otherwise
+        the whole frame is flipped. An unchanged frame presents nothing.
+        Frames whose signature was composed recently are replayed from a
+        cached surface without walking the tree at all.
+
         Args:
             root_widget_data: Root widget data dictionary
+            sig: Tree signature from the caller, used as the replay
+                cache key (optional)
         """
+        if sig is not None:
+            cached = self._frame_cache.get(sig)
+            if cached is not None:
+                # Replay the pixels only. The signature ignores
+                # callbacks, so the cached tree's dicts may carry
+                # handlers bound to widgets that no longer exist;
+                # events must keep dispatching into the current tree.
+                # The parallel walk hands the current dicts the bounds
+                # drawn for the cached frame, then the hit buffer is
+                # rebuilt against those live dicts.
+                self._frame_cache.move_to_end(sig)
+                frame, edges, widgets, tree = cached
+                self.screen.blit(frame, (0, 0))
+                paired: Dict[int, Dict[str, Any]] = {}
+                _adopt_drawn_state(tree, root_widget_data, paired)
+                self._hit_edges = list(edges)
+                self._hit_widgets = [paired[id(w)] for w in widgets]
+                self._prev_tree = root_widget_data
+                pygame.display.flip()
+                return
+
         # Clear screen with light gray background
         self.screen.fill((245, 245, 247))
-        
+
+        # Rebuild the flat hit-test buffer for this frame
+        self._hit_edges.clear()
+        self._hit_widgets.clear()
+
         # Draw widget tree
         self.draw_widget(root_widget_data, self.screen)
-        
-        # Update display
-        pygame.display.flip()
+
+        # Flush queued text in one batched call instead of N blits
+        if self._pending_blits:
+            fblits = getattr(self.screen, 'fblits', None)
+            if fblits is not None:
+                fblits(self._pending_blits)
+            else:
+                self.screen.blits(self._pending_blits)
+            self._pending_blits.clear()
+
+        # Diff against the previous frame to localize the update
+        dirty_rects = None
+        if self._prev_tree is not None:
+            dirty_rects = []
+            if not self._collect_dirty_rects(self._prev_tree, root_widget_data,
+                                             dirty_rects):
+                dirty_rects = None
+        self._prev_tree = root_widget_data
+
+        if dirty_rects is None or len(dirty_rects) > MAX_DIRTY_RECTS:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+
+        # Remember the composed frame for signature-keyed replay
+        if sig is not None:
+            self._frame_cache[sig] = (self.screen.copy(),
+                                      list(self._hit_edges),
+                                      list(self._hit_widgets),
+                                      root_widget_data)
+            while len(self._frame_cache) > self._frame_cache_size:
+                self._frame_cache.popitem(last=False)
     
     def hit_test(self, x: int, y: int, widget_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -408,51 +902,66 @@ class PygameBackend:
         Returns:
             Widget data if hit, None otherwise
         """
-        # Check if this widget has bounds
+        # Fast path: scan the flat edge buffer built during drawing
+        if self._hit_edges:
+            return _hit_scan(x, y, self._hit_edges, self._hit_widgets)
+
+        # Fallback for trees that have not been drawn yet
+        # Check if this widget has bounds; a miss on a bounded widget
+        # also rules out its whole subtree, since children are drawn
+        # inside their container's rect
         bounds = widget_data.get('_bounds')
         if bounds:
             wx, wy, ww, wh = bounds
             if wx <= x <= wx + ww and wy <= y <= wy + wh:
                 return widget_data
-        
-        # Check children (for layouts)
-        children = widget_data.get('children', [])
-        for child in reversed(children):  # Check top to bottom
-            result = self.hit_test(x, y, child)
-            if result:
-                return result
-        
+            return None
+
+        # Check children top to bottom by index, avoiding the reversed()
+        # iterator allocation per layout node on every pointer event
+        children = widget_data.get('children')
+        if children:
+            hit = self.hit_test
+            for i in range(len(children) - 1, -1, -1):
+                result = hit(x, y, children[i])
+                if result:
+                    return result
+
         return None
     
-    def handle_event(self, event: pygame.event.Event, root_widget_data: Dict[str, Any]) -> bool:
+    def handle_event(self, event: pygame.event.Event,
+                     root_widget_data: Dict[str, Any]) -> Tuple[bool, bool]:
         """
         Handle a Pygame event.
-        
+
         Args:
             event: Pygame event
             root_widget_data: Root widget data for hit testing
-            
+
         Returns:
-            True if should continue running, False to quit
+            (should_continue, state_changed) tuple: should_continue is
+            False to quit; state_changed is True when a handler ran and
+            the UI may need a rebuild
         """
         if event.type == pygame.QUIT:
-            return False
-        
+            return False, False
+
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
                 x, y = event.pos
                 hit_widget = self.hit_test(x, y, root_widget_data)
-                
+
                 if hit_widget:
                     widget_type = hit_widget.get('type')
-                    
+
                     if widget_type == 'button' or widget_type == 'switch':
-                        # Call the on_press handler
+                        # Call the on_press handler, coalescing State updates
                         on_press = hit_widget.get('on_press')
                         if on_press and callable(on_press):
-                            on_press()
-                            return True  # Trigger redraw
-                    
+                            with batch():
+                                on_press()
+                            return True, True  # Trigger redraw
+
                     elif widget_type == 'slider':
                         # Handle slider click
                         on_drag = hit_widget.get('on_drag')
@@ -461,10 +970,11 @@ class PygameBackend:
                             slider_x = bounds[0]
                             slider_width = bounds[2]
                             relative_x = x - slider_x
-                            on_drag(relative_x, slider_width)
-                            return True
-        
-        return True
+                            with batch():
+                                on_drag(relative_x, slider_width)
+                            return True, True
+
+        return True, False
     
     def run(self, app_instance) -> None:
         """
@@ -474,28 +984,37 @@ class PygameBackend:
             app_instance: PocketPy App instance
         """
         self.running = True
-        
+
+        # Force the first frame to build and draw
+        needs_redraw = True
+
         print(f"Pygame window opened: {self.width}x{self.height}")
         print("Click the buttons to interact!")
-        
+
         while self.running:
-            # Build UI tree ONCE per frame (important for callbacks!)
-            if app_instance._root_widget:
-                ui_tree = app_instance._root_widget.build()
-            else:
-                ui_tree = {}
-            
-            # Handle events using the SAME tree
+            # Hit-test against the last drawn tree: its dicts carry the
+            # _bounds written during drawing
+            event_tree = self._prev_tree if self._prev_tree is not None else {}
             for event in pygame.event.get():
-                should_continue = self.handle_event(event, ui_tree)
+                should_continue, state_changed = self.handle_event(event, event_tree)
+                if state_changed:
+                    needs_redraw = True
                 if not should_continue:
                     self.running = False
                     break
-            
-            # Draw frame using the SAME tree
-            if ui_tree:
-                self.draw(ui_tree)
-            
+
+            # Rebuild and draw only when an event may have changed state;
+            # idle frames cost just the event poll and the tick sleep
+            if needs_redraw:
+                root_widget = app_instance.refresh_view()
+                ui_tree = root_widget.build() if root_widget else {}
+                if ui_tree:
+                    sig = _tree_signature(ui_tree)
+                    if sig != self._prev_sig:
+                        self.draw(ui_tree, sig)
+                        self._prev_sig = sig
+                needs_redraw = False
+
             # Cap FPS
             self.clock.tick(self.fps)
         
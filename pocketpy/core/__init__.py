@@ -4,6 +4,6 @@ Contains the main application logic and state management
 """
 
 from pocketpy.core.app import App, View
-from pocketpy.core.state import State
+from pocketpy.core.state import State, Memo, batch
 
-__all__ = ["App", "View", "State"]
+__all__ = ["App", "View", "State", "Memo", "batch"]
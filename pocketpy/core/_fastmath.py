@@ -0,0 +1,45 @@
+"""
+Fast approximate math routines for PocketPy framework
+
+Animation easings only need a few decimal digits of accuracy, far less
+than libm delivers. fast_exp trades that surplus precision for a short
+Horner polynomial. It is opt-in: set POCKETPY_FAST_MATH=1 to have the
+animation module bind its exp calls to the approximation.
+"""
+
+import math
+import os
+
+# Opt-in toggle, mirroring the POCKETPY_DEBUG convention in log
+USE_FAST_MATH = os.environ.get("POCKETPY_FAST_MATH") == "1"
+
+_LOG2E = 1.4426950408889634
+
+
+def fast_exp(x: float) -> float:
+    """
+    Approximate exp(x) with a 4th-order minimax polynomial.
+
+    The argument is range-reduced to 2**i * 2**f with f in [0, 1); the
+    fractional power comes from a Horner-form polynomial. Relative error
+    is around 1e-6, orders of magnitude below anything visible in a UI
+    animation.
+
+    Args:
+        x: Exponent
+
+    Returns:
+        Approximation of e**x
+    """
+    z = x * _LOG2E
+    i = int(z)
+    if z < i:
+        i -= 1
+    f = z - i
+
+    p = 0.013670309453356566
+    p = p * f + 0.051744997764068046
+    p = p * f + 0.24160435727009855
+    p = p * f + 0.6929729221730483
+    p = p * f + 1.0000034929076982
+    return math.ldexp(p, i)
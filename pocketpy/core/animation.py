@@ -5,145 +5,366 @@ Animation system for PocketPy framework
 import math
 import time
 from typing import Callable, Optional, Any
-from dataclasses import dataclass
 
+from pocketpy.core._fastmath import USE_FAST_MATH, fast_exp
 
-class Easing:
-    """Easing functions for smooth animations"""
-    
-    @staticmethod
-    def linear(t: float) -> float:
-        """Linear easing (no acceleration)"""
+# math.exp has a faster C path than math.pow(2, x); precompute ln(2) so
+# 2**x becomes exp(_LN2 * x), and bind exp locally to skip the module
+# attribute lookup per call. With POCKETPY_FAST_MATH=1 the polynomial
+# approximation is bound instead.
+_LN2 = 0.6931471805599453
+_exp = fast_exp if USE_FAST_MATH else math.exp
+_sin = math.sin
+_cos = math.cos
+
+# Angular frequency of the elastic oscillation, folded from
+# 2 * pi / 0.3 so the hot body does one multiply
+_ELASTIC_OMEGA = 2 * math.pi / 0.3
+
+
+def linear(t: float) -> float:
+    """Linear easing (no acceleration)"""
+    return t
+
+
+def ease_in_quad(t: float) -> float:
+    """Quadratic ease in (accelerating from zero velocity)"""
+    return t * t
+
+
+def ease_out_quad(t: float) -> float:
+    """Quadratic ease out (decelerating to zero velocity)"""
+    return t * (2 - t)
+
+
+def ease_in_out_quad(t: float) -> float:
+    """Quadratic ease in and out"""
+    return 2 * t * t if t < 0.5 else -1 + (4 - 2 * t) * t
+
+
+def ease_in_cubic(t: float) -> float:
+    """Cubic ease in"""
+    return t * t * t
+
+
+def ease_out_cubic(t: float) -> float:
+    """Cubic ease out"""
+    t -= 1
+    return t * t * t + 1
+
+
+def ease_in_out_cubic(t: float) -> float:
+    """Cubic ease in and out"""
+    if t < 0.5:
+        return 4 * t * t * t
+    t = 2 * t - 2
+    return 1 + t * t * t / 2
+
+
+def ease_in_quart(t: float) -> float:
+    """Quartic ease in"""
+    t2 = t * t
+    return t2 * t2
+
+
+def ease_out_quart(t: float) -> float:
+    """Quartic ease out"""
+    t -= 1
+    t2 = t * t
+    return 1 - t2 * t2
+
+
+def ease_in_out_quart(t: float) -> float:
+    """Quartic ease in and out"""
+    if t < 0.5:
+        t2 = t * t
+        return 8 * t2 * t2
+    t -= 1
+    t2 = t * t
+    return 1 - 8 * t2 * t2
+
+
+def ease_in_expo(t: float) -> float:
+    """Exponential ease in"""
+    return 0 if t == 0 else _exp(_LN2 * 10 * (t - 1))
+
+
+def ease_out_expo(t: float) -> float:
+    """Exponential ease out"""
+    return 1 if t == 1 else 1 - _exp(_LN2 * -10 * t)
+
+
+def ease_in_out_expo(t: float) -> float:
+    """Exponential ease in and out"""
+    if t == 0 or t == 1:
         return t
-    
-    @staticmethod
-    def ease_in_quad(t: float) -> float:
-        """Quadratic ease in (accelerating from zero velocity)"""
-        return t * t
-    
-    @staticmethod
-    def ease_out_quad(t: float) -> float:
-        """Quadratic ease out (decelerating to zero velocity)"""
-        return t * (2 - t)
-    
-    @staticmethod
-    def ease_in_out_quad(t: float) -> float:
-        """Quadratic ease in and out"""
-        return 2 * t * t if t < 0.5 else -1 + (4 - 2 * t) * t
-    
-    @staticmethod
-    def ease_in_cubic(t: float) -> float:
-        """Cubic ease in"""
-        return t * t * t
-    
-    @staticmethod
-    def ease_out_cubic(t: float) -> float:
-        """Cubic ease out"""
-        t -= 1
-        return t * t * t + 1
-    
-    @staticmethod
-    def ease_in_out_cubic(t: float) -> float:
-        """Cubic ease in and out"""
-        if t < 0.5:
-            return 4 * t * t * t
-        t = 2 * t - 2
-        return 1 + t * t * t / 2
-    
-    @staticmethod
-    def ease_in_quart(t: float) -> float:
-        """Quartic ease in"""
-        return t * t * t * t
-    
-    @staticmethod
-    def ease_out_quart(t: float) -> float:
-        """Quartic ease out"""
-        t -= 1
-        return 1 - t * t * t * t
-    
-    @staticmethod
-    def ease_in_out_quart(t: float) -> float:
-        """Quartic ease in and out"""
-        if t < 0.5:
-            return 8 * t * t * t * t
-        t -= 1
-        return 1 - 8 * t * t * t * t
-    
-    @staticmethod
-    def ease_in_expo(t: float) -> float:
-        """Exponential ease in"""
-        return 0 if t == 0 else math.pow(2, 10 * (t - 1))
-    
-    @staticmethod
-    def ease_out_expo(t: float) -> float:
-        """Exponential ease out"""
-        return 1 if t == 1 else 1 - math.pow(2, -10 * t)
-    
-    @staticmethod
-    def ease_in_out_expo(t: float) -> float:
-        """Exponential ease in and out"""
-        if t == 0 or t == 1:
-            return t
-        if t < 0.5:
-            return math.pow(2, 20 * t - 10) / 2
-        return (2 - math.pow(2, -20 * t + 10)) / 2
-    
-    @staticmethod
-    def ease_out_bounce(t: float) -> float:
-        """Bounce ease out"""
-        if t < 1 / 2.75:
-            return 7.5625 * t * t
-        elif t < 2 / 2.75:
-            t -= 1.5 / 2.75
-            return 7.5625 * t * t + 0.75
-        elif t < 2.5 / 2.75:
-            t -= 2.25 / 2.75
-            return 7.5625 * t * t + 0.9375
-        else:
-            t -= 2.625 / 2.75
-            return 7.5625 * t * t + 0.984375
-    
-    @staticmethod
-    def ease_out_elastic(t: float) -> float:
-        """Elastic ease out"""
-        if t == 0 or t == 1:
-            return t
-        return math.pow(2, -10 * t) * math.sin((t - 0.075) * (2 * math.pi) / 0.3) + 1
-    
-    @staticmethod
-    def spring(t: float, damping: float = 0.5) -> float:
-        """Spring physics simulation"""
-        return 1 - math.exp(-damping * t) * math.cos(10 * t)
+    if t < 0.5:
+        return _exp(_LN2 * (20 * t - 10)) / 2
+    return (2 - _exp(_LN2 * (-20 * t + 10))) / 2
+
+
+# Bounce segments as (parabola offset, vertical shift). Segment edges
+# sit at t = 1/2.75, 2/2.75 and 2.5/2.75; on a half-unit grid (u =
+# t * 5.5) those are u = 2, 4 and 5, so a 6-entry index table replaces
+# the comparison ladder.
+_BOUNCE_SEGMENTS = (
+    (0.0, 0.0),
+    (1.5 / 2.75, 0.75),
+    (2.25 / 2.75, 0.9375),
+    (2.625 / 2.75, 0.984375),
+)
+_BOUNCE_IDX = (0, 0, 1, 1, 2, 3)
+
+
+def ease_out_bounce(t: float) -> float:
+    """Bounce ease out"""
+    u = int(t * 5.5)
+    offset, add = _BOUNCE_SEGMENTS[_BOUNCE_IDX[u if u < 6 else 5]]
+    t -= offset
+    return 7.5625 * t * t + add
+
+
+# One-slot memo for the trig-heavy easings: sibling widgets animated by
+# the same driver see identical progress values within a frame, so the
+# previous (input, output) pair answers most calls
+_elastic_last_t: Optional[float] = None
+_elastic_last_v = 0.0
+_spring_last_key: Optional[tuple] = None
+_spring_last_v = 0.0
+
+
+def ease_out_elastic(t: float) -> float:
+    """Elastic ease out"""
+    global _elastic_last_t, _elastic_last_v
+    if t == _elastic_last_t:
+        return _elastic_last_v
+    if t == 0 or t == 1:
+        return t
+    v = _exp(_LN2 * -10 * t) * _sin((t - 0.075) * _ELASTIC_OMEGA) + 1
+    _elastic_last_t = t
+    _elastic_last_v = v
+    return v
+
+
+def spring(t: float, damping: float = 0.5) -> float:
+    """Spring physics simulation"""
+    global _spring_last_key, _spring_last_v
+    key = (t, damping)
+    if key == _spring_last_key:
+        return _spring_last_v
+    v = 1 - _exp(-damping * t) * _cos(10 * t)
+    _spring_last_key = key
+    _spring_last_v = v
+    return v
+
+
+# Table-lookup versions of easing functions, built lazily per function.
+# 1024 buckets keep quantization well below a pixel for UI value ranges.
+_EASING_LUTS: dict = {}
+_LUT_SIZE = 1024
+
+# Curves whose per-call math (exp/sin/cos or branching) costs more than
+# a list index; cheap polynomial easings stay as direct calls
+_LUT_WORTHWHILE = frozenset((
+    ease_in_expo, ease_out_expo, ease_in_out_expo,
+    ease_out_bounce, ease_out_elastic, spring,
+))
+
+
+def precompute_lut(fn: Callable[[float], float],
+                   n: int = _LUT_SIZE) -> Callable[[float], float]:
+    """
+    Build (once) a table-lookup replacement for an easing function.
+
+    The returned callable samples the curve at n points and answers each
+    call with one list index instead of the original math chain.
+
+    Args:
+        fn: Easing function taking progress in [0, 1]
+        n: Number of samples in the lookup table
+
+    Returns:
+        Drop-in easing callable backed by the precomputed table
+    """
+    fn = getattr(fn, '__func__', fn)
+    lookup = _EASING_LUTS.get(fn)
+    if lookup is None:
+        scale = n - 1
+        table = [fn(i / scale) for i in range(n)]
+
+        def lookup(t: float, _table=table, _scale=scale) -> float:
+            return _table[int(t * _scale)]
+
+        _EASING_LUTS[fn] = lookup
+    return lookup
+
+
+class Easing:
+    """
+    Easing functions for smooth animations.
+
+    The implementations live at module level so the per-frame call in
+    AnimationState is a plain function call; the class only namespaces
+    them for the public API.
+    """
+
+    linear = staticmethod(linear)
+    ease_in_quad = staticmethod(ease_in_quad)
+    ease_out_quad = staticmethod(ease_out_quad)
+    ease_in_out_quad = staticmethod(ease_in_out_quad)
+    ease_in_cubic = staticmethod(ease_in_cubic)
+    ease_out_cubic = staticmethod(ease_out_cubic)
+    ease_in_out_cubic = staticmethod(ease_in_out_cubic)
+    ease_in_quart = staticmethod(ease_in_quart)
+    ease_out_quart = staticmethod(ease_out_quart)
+    ease_in_out_quart = staticmethod(ease_in_out_quart)
+    ease_in_expo = staticmethod(ease_in_expo)
+    ease_out_expo = staticmethod(ease_out_expo)
+    ease_in_out_expo = staticmethod(ease_in_out_expo)
+    ease_out_bounce = staticmethod(ease_out_bounce)
+    ease_out_elastic = staticmethod(ease_out_elastic)
+    spring = staticmethod(spring)
+    precompute_lut = staticmethod(precompute_lut)
+
+
+# Fused step factories: bake an animation's constants and curve into a
+# closure at start, so the per-frame step is straight-line arithmetic on
+# locals with no attribute loads and, for known easings, no inner call.
+def _fuse_linear(st, inv, sv, dv, ev):
+    def step(now):
+        p = (now - st) * inv
+        if p >= 1.0:
+            return ev, True
+        return sv + dv * p, False
+    return step
+
+
+def _fuse_in_quad(st, inv, sv, dv, ev):
+    def step(now):
+        p = (now - st) * inv
+        if p >= 1.0:
+            return ev, True
+        return sv + dv * p * p, False
+    return step
+
+
+def _fuse_out_cubic(st, inv, sv, dv, ev):
+    def step(now):
+        p = (now - st) * inv
+        if p >= 1.0:
+            return ev, True
+        p -= 1.0
+        return sv + dv * (p * p * p + 1.0), False
+    return step
+
+
+def _fuse_in_out_cubic(st, inv, sv, dv, ev):
+    def step(now):
+        p = (now - st) * inv
+        if p >= 1.0:
+            return ev, True
+        if p < 0.5:
+            return sv + dv * 4.0 * p * p * p, False
+        p = 2.0 * p - 2.0
+        return sv + dv * (1.0 + p * p * p / 2.0), False
+    return step
+
+
+def _fuse_generic(st, inv, sv, dv, ev, easing):
+    def step(now):
+        p = (now - st) * inv
+        if p >= 1.0:
+            return ev, True
+        return sv + dv * easing(p), False
+    return step
+
+
+_FUSED_FACTORIES = {
+    linear: _fuse_linear,
+    ease_in_quad: _fuse_in_quad,
+    ease_out_cubic: _fuse_out_cubic,
+    ease_in_out_cubic: _fuse_in_out_cubic,
+}
 
 
-@dataclass
 class AnimationState:
     """State of an ongoing animation"""
-    start_time: float
-    duration: float
-    start_value: float
-    end_value: float
-    easing: Callable[[float], float]
-    on_update: Callable[[float], None]
-    on_complete: Optional[Callable[[], None]] = None
-    
+
+    __slots__ = ('start_time', 'duration', 'start_value', 'end_value',
+                 '_delta', '_inv_duration', '_fused', 'easing',
+                 'on_update', 'on_complete')
+
+    def __init__(
+        self,
+        start_time: float,
+        duration: float,
+        start_value: float,
+        end_value: float,
+        easing: Callable[[float], float],
+        on_update: Callable[[float], None],
+        on_complete: Optional[Callable[[], None]] = None
+    ):
+        """
+        Initialize animation state.
+
+        Args:
+            start_time: time.monotonic_ns() timestamp the animation
+                started at
+            duration: Duration in seconds
+            start_value: Starting value
+            end_value: Ending value
+            easing: Easing function
+            on_update: Callback with current value
+            on_complete: Callback when animation completes
+        """
+        self.start_time = start_time
+        self.duration = duration
+        self.start_value = start_value
+        self.end_value = end_value
+        self.easing = easing
+        self.on_update = on_update
+        self.on_complete = on_complete
+
+        # Cached per-frame constants: the value span and the reciprocal
+        # duration in nanoseconds, turning the step into one
+        # multiply-add on the integer clock delta
+        self._delta = end_value - start_value
+        self._inv_duration = 1.0 / (duration * 1e9)
+
+        # Specialized step closure with all constants baked in
+        factory = _FUSED_FACTORIES.get(easing)
+        if factory is not None:
+            self._fused = factory(start_time, self._inv_duration,
+                                  start_value, self._delta, end_value)
+        else:
+            self._fused = _fuse_generic(start_time, self._inv_duration,
+                                        start_value, self._delta,
+                                        end_value, easing)
+
+    def _step(self, now: int) -> tuple[float, bool]:
+        """
+        Advance the animation to a shared timestamp.
+
+        Taking the timestamp as an argument lets the controller read the
+        clock once per tick instead of twice per animation, and keeps
+        concurrent animations frame-aligned.
+
+        Args:
+            now: Current time (time.monotonic_ns()), shared across
+                animations
+
+        Returns:
+            (current value, whether the animation has finished)
+        """
+        return self._fused(now)
+
     def get_current_value(self) -> float:
         """Calculate current value based on elapsed time"""
-        elapsed = time.time() - self.start_time
-        progress = min(1.0, elapsed / self.duration)
-        
-        # Apply easing
-        eased_progress = self.easing(progress)
-        
-        # Interpolate value
-        current_value = self.start_value + (self.end_value - self.start_value) * eased_progress
-        
-        return current_value
-    
+        return self._step(time.monotonic_ns())[0]
+
     def is_complete(self) -> bool:
         """Check if animation is complete"""
-        elapsed = time.time() - self.start_time
-        return elapsed >= self.duration
+        return (time.monotonic_ns() - self.start_time) * self._inv_duration >= 1.0
 
 
 class AnimationController:
@@ -192,8 +413,15 @@ class AnimationController:
         Returns:
             AnimationState object
         """
+        # Unwrap staticmethod objects once so the per-frame call in
+        # _step is a plain function call; expensive curves swap to their
+        # table-lookup form
+        easing = getattr(easing, '__func__', easing)
+        if easing in _LUT_WORTHWHILE:
+            easing = precompute_lut(easing)
+
         anim = AnimationState(
-            start_time=time.time(),
+            start_time=time.monotonic_ns(),
             duration=duration,
             start_value=from_value,
             end_value=to_value,
@@ -206,27 +434,31 @@ class AnimationController:
         return anim
     
     def update(self) -> None:
-        """Update all active animations"""
-        completed = []
-        
-        for anim in self.active_animations:
-            if anim.is_complete():
-                # Final update with end value
-                anim.on_update(anim.end_value)
-                
-                # Call completion callback
+        """Update all active animations against one shared timestamp"""
+        # Idle short-circuit: the main loop calls this every frame, and
+        # zero animations is the common steady state
+        if not self.active_animations:
+            return
+
+        now = time.monotonic_ns()
+        anims = self.active_animations
+
+        # Compact in place with a write index: live animations slide
+        # down over finished ones and the tail is truncated, instead of
+        # a linear remove() scan per completed animation. Each entry's
+        # fused step closure already has its constants and easing baked
+        # in, so the tick does one call per animation over locals only.
+        w = 0
+        for anim in anims:
+            current_value, done = anim._fused(now)
+            anim.on_update(current_value)
+            if done:
                 if anim.on_complete:
                     anim.on_complete()
-                
-                completed.append(anim)
             else:
-                # Update with current value
-                current_value = anim.get_current_value()
-                anim.on_update(current_value)
-        
-        # Remove completed animations
-        for anim in completed:
-            self.active_animations.remove(anim)
+                anims[w] = anim
+                w += 1
+        del anims[w:]
     
     def cancel_all(self) -> None:
         """Cancel all active animations"""
@@ -237,6 +469,25 @@ class AnimationController:
         return len(self.active_animations) > 0
 
 
+class _AttrSetter:
+    """
+    Animation callback that writes one attribute on one object.
+
+    Transitions previously allocated a fresh closure (function object
+    plus cell) per animated widget; this slotted callable is cheaper to
+    create and its __call__ is a single setattr.
+    """
+
+    __slots__ = ('obj', 'attr')
+
+    def __init__(self, obj: Any, attr: str):
+        self.obj = obj
+        self.attr = attr
+
+    def __call__(self, value: float) -> None:
+        setattr(self.obj, self.attr, value)
+
+
 class Transition:
     """
     Predefined transition animations.
@@ -255,10 +506,8 @@ class Transition:
         if controller is None:
             controller = AnimationController()
         
-        def update(value):
-            widget.opacity = value
-        
-        controller.animate(0.0, 1.0, duration, Easing.ease_out_cubic, update)
+        controller.animate(0.0, 1.0, duration, Easing.ease_out_cubic,
+                           _AttrSetter(widget, 'opacity'))
         return controller
     
     @staticmethod
@@ -267,10 +516,8 @@ class Transition:
         if controller is None:
             controller = AnimationController()
         
-        def update(value):
-            widget.opacity = value
-        
-        controller.animate(1.0, 0.0, duration, Easing.ease_in_cubic, update)
+        controller.animate(1.0, 0.0, duration, Easing.ease_in_cubic,
+                           _AttrSetter(widget, 'opacity'))
         return controller
     
     @staticmethod
@@ -279,10 +526,8 @@ class Transition:
         if controller is None:
             controller = AnimationController()
         
-        def update(value):
-            widget.scale = value
-        
-        controller.animate(0.0, 1.0, duration, Easing.ease_out_back, update)
+        controller.animate(0.0, 1.0, duration, Easing.ease_out_back,
+                           _AttrSetter(widget, 'scale'))
         return controller
     
     @staticmethod
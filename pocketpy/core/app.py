@@ -5,6 +5,9 @@ Main App class for PocketPy framework
 from typing import Optional, Any, Type
 from abc import ABC
 
+from pocketpy.core.reconcile import reconcile
+from pocketpy.core.state import Memo
+
 
 class View(ABC):
     """
@@ -73,6 +76,8 @@ class App:
         self.height = height
         self._view: Optional[View] = None
         self._root_widget: Optional[Any] = None
+        self._body_memo: Optional[Memo] = None
+        self._last_build: Optional[Any] = None
         self._is_running = False
         self._window = None
         self._use_pygame = use_pygame
@@ -93,12 +98,43 @@ class App:
             view_class: A View class (not an instance) to use as the root
         """
         self._view = view_class()
-        self._root_widget = self._view.body()
-        
+
+        # Wrap body() in a dependency-tracked memo: refresh_view() skips
+        # the rebuild entirely while the States it read are unchanged
+        self._body_memo = Memo(self._view.body)
+        self._root_widget = self._body_memo()
+        self._last_build = self._root_widget
+
         # Mount the widget tree
         if self._root_widget:
             self._root_widget.mount()
     
+    def refresh_view(self) -> Optional[Any]:
+        """
+        Rebuild the view's body and merge it into the mounted tree.
+
+        The fresh tree is reconciled against the retained one, mutating
+        matching widgets in place, so unchanged subtrees (including
+        memoized ones that return the same objects) are kept as-is.
+
+        Returns:
+            The root widget after reconciliation
+        """
+        if self._view is None or self._root_widget is None:
+            return self._root_widget
+
+        new_root = self._body_memo()
+        if new_root is self._last_build:
+            # No tracked State changed since the last build
+            return self._root_widget
+        self._last_build = new_root
+
+        if new_root is not self._root_widget:
+            merged = reconcile(self._root_widget, new_root)
+            if merged is not self._root_widget:
+                self._root_widget = merged
+        return self._root_widget
+
     def set_root(self, widget: Any) -> None:
         """
         Set the root widget for the application directly.
@@ -160,8 +196,19 @@ class App:
         print("Main loop started. Press Ctrl+C to exit.")
         try:
             import time
+            # Deadline scheduler: advance a monotonic deadline by one frame
+            # and sleep only the remaining slack, so sleep jitter does not
+            # accumulate into drift the way a fixed sleep(0.016) does
+            FRAME = 1 / 60.0
+            deadline = time.monotonic()
             while self._is_running:
-                time.sleep(0.016)  # ~60 FPS
+                deadline += FRAME
+                slack = deadline - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
+                else:
+                    # Overran the frame budget; rebase instead of racing
+                    deadline = time.monotonic()
         except KeyboardInterrupt:
             self.stop()
     
@@ -2,8 +2,15 @@
 Gesture recognition system for PocketPy framework
 """
 
+import math
 import time
 from typing import Optional, Callable, Tuple
+
+# Local bindings: one C-level call each, looked up once instead of per
+# event. perf_counter_ns keeps timing on a raw integer clock without
+# the float conversion time.time() imposes
+_hypot = math.hypot
+_now_ns = time.perf_counter_ns
 from dataclasses import dataclass
 from enum import Enum
 
@@ -26,7 +33,7 @@ class SwipeDirection(Enum):
     RIGHT = "right"
 
 
-@dataclass
+@dataclass(slots=True)
 class GestureEvent:
     """Gesture event data"""
     gesture_type: GestureType
@@ -76,6 +83,16 @@ class GestureRecognizer:
         self.double_tap_interval = double_tap_interval
         self.swipe_threshold = swipe_threshold
         self.swipe_velocity_threshold = swipe_velocity_threshold
+
+        # Nanosecond forms of the time thresholds; timing runs on the
+        # monotonic integer clock, immune to wall-clock jumps
+        self._long_press_duration_ns = int(long_press_duration * 1e9)
+        self._double_tap_interval_ns = int(double_tap_interval * 1e9)
+
+        # Squared distance thresholds: movement checks compare squared
+        # magnitudes, deferring the sqrt to events that report distance
+        self._tap_threshold_sq = tap_threshold * tap_threshold
+        self._swipe_threshold_sq = swipe_threshold * swipe_threshold
         
         # Callbacks
         self.on_tap: Optional[Callable[[GestureEvent], None]] = None
@@ -89,19 +106,27 @@ class GestureRecognizer:
         # State tracking
         self._is_pressed = False
         self._press_start_pos: Optional[Tuple[int, int]] = None
-        self._press_start_time: Optional[float] = None
+        self._press_start_time: Optional[int] = None
         self._current_pos: Optional[Tuple[int, int]] = None
-        self._last_tap_time: Optional[float] = None
+        self._last_tap_time: Optional[int] = None
         self._last_tap_pos: Optional[Tuple[int, int]] = None
         self._is_dragging = False
         self._long_press_triggered = False
-    
+
+        # Reusable drag event: a continuous drag fires a callback per
+        # pixel of movement, so mutating one scratch instance avoids
+        # allocating thousands of dataclass objects per second
+        self._scratch_event = GestureEvent(
+            gesture_type=GestureType.DRAG,
+            position=(0, 0)
+        )
+
     def handle_mouse_down(self, x: int, y: int) -> None:
         """Handle mouse button down event"""
         self._is_pressed = True
         self._press_start_pos = (x, y)
         self._current_pos = (x, y)
-        self._press_start_time = time.time()
+        self._press_start_time = _now_ns()
         self._is_dragging = False
         self._long_press_triggered = False
     
@@ -112,29 +137,29 @@ class GestureRecognizer:
         
         self._current_pos = (x, y)
         
-        # Calculate distance from start
+        # Calculate squared distance from start; the threshold check
+        # does not need the sqrt
         dx = x - self._press_start_pos[0]
         dy = y - self._press_start_pos[1]
-        distance = (dx * dx + dy * dy) ** 0.5
+        dist_sq = dx * dx + dy * dy
         
         # Check if this is a drag
-        if distance > self.tap_threshold and not self._is_dragging:
+        if dist_sq > self._tap_threshold_sq and not self._is_dragging:
             self._is_dragging = True
-            
-            if self.on_drag_start:
+
+            if self.on_drag_start is not None:
                 event = GestureEvent(
                     gesture_type=GestureType.DRAG,
                     position=(x, y)
                 )
                 self.on_drag_start(event)
-        
-        # Continue drag
-        if self._is_dragging and self.on_drag:
-            event = GestureEvent(
-                gesture_type=GestureType.DRAG,
-                position=(x, y),
-                distance=distance
-            )
+
+        # Continue drag, reusing the scratch event: no listener means no
+        # event construction at all
+        if self._is_dragging and self.on_drag is not None:
+            event = self._scratch_event
+            event.position = (x, y)
+            event.distance = _hypot(dx, dy)
             self.on_drag(event)
     
     def handle_mouse_up(self, x: int, y: int) -> None:
@@ -143,12 +168,13 @@ class GestureRecognizer:
             return
         
         self._is_pressed = False
-        duration = time.time() - self._press_start_time
+        duration = (_now_ns() - self._press_start_time) / 1e9
         
-        # Calculate movement
+        # Calculate squared movement; the real distance is computed
+        # only for events that carry it
         dx = x - self._press_start_pos[0]
         dy = y - self._press_start_pos[1]
-        distance = (dx * dx + dy * dy) ** 0.5
+        dist_sq = dx * dx + dy * dy
         
         # Drag end
         if self._is_dragging:
@@ -156,7 +182,7 @@ class GestureRecognizer:
                 event = GestureEvent(
                     gesture_type=GestureType.DRAG,
                     position=(x, y),
-                    distance=distance,
+                    distance=_hypot(dx, dy),
                     duration=duration
                 )
                 self.on_drag_end(event)
@@ -165,7 +191,8 @@ class GestureRecognizer:
             return
         
         # Check for swipe
-        if distance > self.swipe_threshold:
+        if dist_sq > self._swipe_threshold_sq:
+            distance = _hypot(dx, dy)
             velocity = distance / duration if duration > 0 else 0
             
             if velocity > self.swipe_velocity_threshold:
@@ -184,20 +211,20 @@ class GestureRecognizer:
                 return
         
         # Check for tap (small movement)
-        if distance <= self.tap_threshold:
-            current_time = time.time()
+        if dist_sq <= self._tap_threshold_sq:
+            current_time = _now_ns()
             
             # Check for double tap
             if (self._last_tap_time is not None and 
                 self._last_tap_pos is not None and
-                current_time - self._last_tap_time <= self.double_tap_interval):
+                current_time - self._last_tap_time <= self._double_tap_interval_ns):
                 
                 # Check if taps are close together
                 tap_dx = x - self._last_tap_pos[0]
                 tap_dy = y - self._last_tap_pos[1]
-                tap_distance = (tap_dx * tap_dx + tap_dy * tap_dy) ** 0.5
+                tap_dist_sq = tap_dx * tap_dx + tap_dy * tap_dy
                 
-                if tap_distance <= self.tap_threshold:
+                if tap_dist_sq <= self._tap_threshold_sq:
                     if self.on_double_tap:
                         event = GestureEvent(
                             gesture_type=GestureType.DOUBLE_TAP,
@@ -228,9 +255,9 @@ class GestureRecognizer:
             return
         
         # Check for long press
-        duration = time.time() - self._press_start_time
+        elapsed_ns = _now_ns() - self._press_start_time
         
-        if (duration >= self.long_press_duration and 
+        if (elapsed_ns >= self._long_press_duration_ns and 
             not self._long_press_triggered and 
             not self._is_dragging):
             
@@ -240,7 +267,7 @@ class GestureRecognizer:
                 event = GestureEvent(
                     gesture_type=GestureType.LONG_PRESS,
                     position=self._current_pos,
-                    duration=duration
+                    duration=elapsed_ns / 1e9
                 )
                 self.on_long_press(event)
     
@@ -0,0 +1,42 @@
+"""
+Lightweight debug logging for PocketPy framework
+
+Event handlers run on the UI thread, where print() costs a lock, an
+f-string format and a flush per call. debug() instead appends the raw
+format and arguments to a bounded ring buffer and only formats/emits
+them when the POCKETPY_DEBUG environment variable is set to 1.
+"""
+
+import os
+import sys
+import time
+from collections import deque
+from typing import Any, List, Tuple
+
+_enabled = os.environ.get("POCKETPY_DEBUG") == "1"
+
+# Most recent messages, oldest evicted first
+_buffer: deque = deque(maxlen=1024)
+
+
+def debug(fmt: str, *args: Any) -> None:
+    """
+    Record a debug message without formatting it.
+
+    Args:
+        fmt: printf-style format string
+        *args: Arguments deferred until the message is actually emitted
+    """
+    _buffer.append((time.time(), fmt, args))
+    if _enabled:
+        print(fmt % args if args else fmt, file=sys.stderr)
+
+
+def dump() -> List[Tuple[float, str, tuple]]:
+    """
+    Return the buffered messages, oldest first.
+
+    Returns:
+        List of (timestamp, format, args) tuples
+    """
+    return list(_buffer)
@@ -2,6 +2,9 @@
 Navigation and routing system for PocketPy framework
 """
 
+import weakref
+
+from types import MappingProxyType
 from typing import Optional, Dict, Callable, Any, List
 from pocketpy.core.app import View
 from pocketpy.core.animation import AnimationController, Easing
@@ -14,7 +17,10 @@ class Route:
     Example:
         >>> route = Route(name="home", view_class=HomeView, params={"user_id": 123})
     """
-    
+
+    __slots__ = ("name", "view_class", "params", "transition",
+                 "_params_items", "_view_ref")
+
     def __init__(
         self,
         name: str,
@@ -33,20 +39,31 @@ class Route:
         """
         self.name = name
         self.view_class = view_class
-        self.params = params or {}
+        raw_params = params or {}
+        # Read-only view: callers cannot mutate params behind the
+        # pre-baked items tuple below
+        self.params = MappingProxyType(raw_params)
         self.transition = transition
-        self._view_instance: Optional[View] = None
-    
+        # Pre-baked (name, value) pairs so get_view skips the .items()
+        # call on the navigation hot path
+        self._params_items = tuple(raw_params.items())
+        # Weak reference: views for routes the user has left can be
+        # reclaimed by GC and are rebuilt on the next visit
+        self._view_ref: Optional[weakref.ref] = None
+
     def get_view(self) -> View:
         """Get or create view instance"""
-        if self._view_instance is None:
-            self._view_instance = self.view_class()
-            
+        view = self._view_ref() if self._view_ref is not None else None
+        if view is None:
+            view = self.view_class()
+
             # Set params as attributes
-            for key, value in self.params.items():
-                setattr(self._view_instance, key, value)
-        
-        return self._view_instance
+            for key, value in self._params_items:
+                setattr(view, key, value)
+
+            self._view_ref = weakref.ref(view)
+
+        return view
 
 
 class Navigator:
@@ -152,8 +169,9 @@ class Navigator:
     def pop_to_root(self) -> None:
         """Pop all routes except the root"""
         if len(self.stack) > 1:
-            self.stack = [self.stack[0]]
-            
+            # Truncate in place so the list keeps its allocated buffer
+            del self.stack[1:]
+
             if self.on_back:
                 self.on_back()
     
@@ -247,15 +265,21 @@ class NavigationBar(View):
         self.on_back = on_back
         self.background_color = background_color
         self.text_color = text_color
-    
+
+    # Constant part of the body dict; unpacking a prebuilt template is
+    # cheaper than rebuilding those entries (keys arrive pre-hashed)
+    _BODY_TEMPLATE = {
+        "type": "navigationbar",
+        "height": 44
+    }
+
     def body(self) -> dict:
         """Build navigation bar"""
         return {
-            "type": "navigationbar",
+            **self._BODY_TEMPLATE,
             "title": self.title,
             "show_back": self.show_back,
             "on_back": self.on_back,
             "background_color": self.background_color,
-            "text_color": self.text_color,
-            "height": 44
+            "text_color": self.text_color
         }
@@ -0,0 +1,146 @@
+"""
+Widget tree reconciliation for PocketPy framework
+
+Merges a freshly built widget tree into the retained, mounted one by
+mutating matching widgets in place, so a rebuild replaces only the
+subtrees that actually changed instead of the whole tree.
+"""
+
+from sys import getrefcount
+from typing import Any
+
+# Attributes that describe a widget's place in the retained tree rather
+# than its configuration; these are never copied from the fresh tree.
+# _template stays out too: it embeds the fresh widget's bound handlers,
+# so the retained widget rebuilds its own copy after a change instead.
+# The same goes for the derived accessors _write/_get_text and the
+# _cached_value they maintain: the plain-value closures capture their
+# own instance (copying one would route writes into the discarded
+# duplicate), and closures never compare equal, so copying them would
+# also flag every leaf as changed on every pass. _refresh_template
+# regenerates them from the copied configuration instead.
+_STRUCTURAL_ATTRS = frozenset((
+    "children",
+    "parent",
+    "_x",
+    "_y",
+    "_pos",
+    "_mounted",
+    "_subscriptions",
+    "_dirty",
+    "_built",
+    "_layout_key",
+    "_template",
+    "_write",
+    "_get_text",
+    "_cached_value",
+))
+
+
+def reconcile(old: Any, new: Any, _releasable: bool = True) -> Any:
+    """
+    Merge a freshly built widget subtree into the retained one.
+
+    Widgets of the same type are updated in place: their configuration
+    attributes are copied over (only when different) and their children
+    are reconciled pairwise. When types differ, the new subtree replaces
+    the old one wholesale. Memoized subtrees that return the identical
+    widget object are skipped entirely.
+
+    Args:
+        old: The currently mounted widget
+        new: The widget produced by the latest build
+        _releasable: Whether this fresh subtree may be recycled; cleared
+            for descendants of any widget that proved to be shared
+
+    Returns:
+        The widget to keep in the tree (usually ``old``, mutated)
+    """
+    if old is new:
+        return old
+
+    if type(old) is not type(new):
+        # Different widget type: swap the whole subtree
+        if old._mounted:
+            old.unmount()
+            if not new._mounted:
+                new.mount()
+        return new
+
+    # Same type: copy changed configuration onto the retained widget
+    old_dict = old.__dict__
+    changed = False
+    for name, new_value in new.__dict__.items():
+        if name in _STRUCTURAL_ATTRS:
+            continue
+        if old_dict.get(name) != new_value:
+            old_dict[name] = new_value
+            changed = True
+    if changed:
+        # The retained widget's cached build no longer matches, and its
+        # static template (if any) must be rewritten from the attributes
+        # just copied in
+        old._mark_dirty()
+        old._refresh_template()
+
+    # The fresh duplicate is recycled only when nothing else can reach
+    # it. Bodies may splice memoized or pre-composed widgets into a new
+    # tree at a shifted index; gutting one of those would break the
+    # memo cache (and any live subscriptions) that still point at it.
+    # A true throwaway is referenced only by its slot in the discarded
+    # tree, the local binding here, and getrefcount's own argument —
+    # three references; anything more means the instance is shared and
+    # must survive untouched. The verdict is taken before descending and
+    # inherited by the children: a shared widget's descendants look like
+    # throwaways by refcount alone, yet the shared ancestor keeps the
+    # whole subtree alive.
+    releasable = _releasable and getrefcount(new) <= 3
+
+    _reconcile_children(old, new, releasable)
+
+    if releasable:
+        new._cleanup_subscriptions()
+        new._release()
+    return old
+
+
+def _reconcile_children(old: Any, new: Any, releasable: bool) -> None:
+    """
+    Reconcile two widgets' child lists pairwise by index.
+
+    Args:
+        old: The retained parent widget
+        new: The freshly built parent widget
+        releasable: Whether the fresh parent's subtree may be recycled
+    """
+    old_children = old.children
+    new_children = new.children
+    common = min(len(old_children), len(new_children))
+
+    if len(old_children) != len(new_children) and type(old_children) is tuple:
+        # Childless widgets share the _EMPTY tuple and freeze() converts
+        # lists to tuples; materialize a real list before the child
+        # count changes underneath it
+        old.children = old_children = list(old_children)
+
+    for i in range(common):
+        merged = reconcile(old_children[i], new_children[i], releasable)
+        if merged is not old_children[i]:
+            if type(old_children) is tuple:
+                old.children = old_children = list(old_children)
+            old_children[i] = merged
+            merged.parent = old
+
+    if len(old_children) > common:
+        # Trailing widgets were removed
+        for child in old_children[common:]:
+            child.unmount()
+            child.parent = None
+        del old_children[common:]
+    elif len(new_children) > common:
+        # Trailing widgets were added
+        for child in new_children[common:]:
+            child.parent = old
+            if old._mounted and not child._mounted:
+                child.mount()
+            old_children.append(child)
@@ -3,7 +3,54 @@ Observable State class for PocketPy framework
 Implements reactive state management
 """
 
-from typing import Any, Callable, List
+import threading
+from collections import deque
+from contextlib import contextmanager
+from operator import call as _call
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Zero-length deque: extending it consumes an iterator entirely at C
+# level, discarding results — the fastest way to drain a map()
+_drain = deque(maxlen=0).extend
+
+# Thread-local batching context shared by all State instances
+_batch_context = threading.local()
+
+# Thread-local stack of dependency-tracking frames (see Memo)
+_tracking = threading.local()
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """
+    Coalesce State notifications inside a block.
+
+    While the context is active, assignments to ``State.value`` only record
+    which States changed. On exit, the listeners of each changed State are
+    invoked exactly once, so an event handler that mutates several States
+    triggers a single round of updates instead of one per assignment.
+
+    Example:
+        >>> with batch():
+        ...     count.value += 1
+        ...     step.value = 5
+        ... # Listeners fire once here, on exit
+    """
+    if getattr(_batch_context, "active", False):
+        # Nested batches flush together with the outermost one
+        yield
+        return
+
+    _batch_context.active = True
+    _batch_context.pending = set()
+    try:
+        yield
+    finally:
+        pending = _batch_context.pending
+        _batch_context.active = False
+        _batch_context.pending = None
+        for state in pending:
+            state._notify()
 
 
 class State:
@@ -18,46 +65,200 @@ class State:
         >>> state.subscribe(lambda: print(f"State changed to: {state.value}"))
         >>> state.value = 5  # Triggers listener notification
     """
-    
-    def __init__(self, initial_value: Any):
+
+    __slots__ = ("_value", "_listeners", "_formatter", "_str",
+                 "_listeners_version", "_snapshot", "_snapshot_version")
+
+    def __init__(self, initial_value: Any,
+                 formatter: Optional[Callable[[Any], str]] = None):
         """
         Initialize a new State object with an initial value.
-        
+
         Args:
             initial_value: The initial value for this state
+            formatter: Optional value-to-text converter used by
+                :attr:`formatted` (defaults to ``str``)
         """
         self._value: Any = initial_value
-        self._listeners: List[Callable[[], None]] = []
-    
+        # Dict rather than list: O(1) membership on subscribe/unsubscribe
+        # while keeping insertion order for notification
+        self._listeners: Dict[Callable[[], None], None] = {}
+        self._formatter = formatter
+        self._str: Optional[str] = None
+
+        # Copy-on-write listener snapshot: _notify iterates a cached
+        # tuple that is only rebuilt when the listener set has changed,
+        # so callbacks may subscribe/unsubscribe mid-notification
+        self._listeners_version = 0
+        self._snapshot: tuple = ()
+        self._snapshot_version = -1
+
     def subscribe(self, listener: Callable[[], None]) -> None:
         """
         Subscribe a listener function to state changes.
-        
+
         Args:
             listener: A callback function that will be called when state changes
         """
         if listener not in self._listeners:
-            self._listeners.append(listener)
+            self._listeners[listener] = None
+            self._listeners_version += 1
+
+    def unsubscribe(self, listener: Callable[[], None]) -> None:
+        """
+        Remove a previously subscribed listener.
+
+        Unknown listeners are ignored, so cleanup paths can call this
+        unconditionally.
+
+        Args:
+            listener: The callback passed to :meth:`subscribe`
+        """
+        if listener in self._listeners:
+            del self._listeners[listener]
+            self._listeners_version += 1
     
     @property
     def value(self) -> Any:
         """
         Get the current state value.
-        
+
         Returns:
             The current value
         """
+        frames = getattr(_tracking, "frames", None)
+        if frames:
+            # Memo builders are running; record this State as a dependency
+            # of every frame on the stack so nested memos do not hide
+            # reads from their enclosing ones
+            for frame in frames:
+                frame.add(self)
         return self._value
     
     @value.setter
     def value(self, new_value: Any) -> None:
         """
         Set a new state value and notify all listeners.
-        
+
+        Assigning a value equal to the current one is a no-op: listeners
+        are not notified and no rebuild is triggered. Use :meth:`mutate`
+        after changing a mutable value in place to force a notification.
+
         Args:
             new_value: The new value to set
         """
+        old_value = self._value
+        # Identity first: same object back means no change, without
+        # invoking a potentially deep __eq__ on containers
+        if old_value is new_value or old_value == new_value:
+            return
         self._value = new_value
-        # Notify all listeners
-        for listener in self._listeners:
-            listener()
+        self._str = None  # Invalidate the cached text rendition
+        if getattr(_batch_context, "active", False):
+            # Defer notification; the enclosing batch() flushes once on exit
+            _batch_context.pending.add(self)
+            return
+        self._notify()
+
+    @property
+    def formatted(self) -> str:
+        """
+        Text rendition of the current value, cached per change.
+
+        Rendering loops can read this every frame: the conversion runs
+        once after each mutation instead of once per paint.
+
+        Returns:
+            The formatted value string
+        """
+        text = self._str
+        if text is None:
+            formatter = self._formatter
+            text = self._str = formatter(self._value) if formatter else str(self._value)
+        return text
+
+    def mutate(self) -> None:
+        """
+        Notify listeners without assigning a new value.
+
+        Needed when the stored value is a mutable container that was
+        changed in place, since the setter's equality check would treat
+        re-assigning the same object as a no-op.
+        """
+        self._str = None
+        if getattr(_batch_context, "active", False):
+            _batch_context.pending.add(self)
+            return
+        self._notify()
+
+    def _notify(self) -> None:
+        """
+        Notify all listeners of a value change.
+        """
+        if self._snapshot_version != self._listeners_version:
+            self._snapshot = tuple(self._listeners)
+            self._snapshot_version = self._listeners_version
+        # map + operator.call keeps the dispatch loop in C instead of
+        # interpreting FOR_ITER/CALL bytecode per listener
+        _drain(map(_call, self._snapshot))
+
+
+class Memo:
+    """
+    Caches the result of a builder function until its State inputs change.
+
+    The builder runs inside a tracking frame that records every State whose
+    value it reads. On later calls, the cached result is returned as long as
+    each recorded State still holds the value it had when the cache was
+    filled, so unchanged subtrees are not rebuilt.
+
+    Example:
+        >>> header = Memo(build_header)
+        >>> header()  # Runs build_header and caches the result
+        >>> header()  # Returns the cached result without rebuilding
+    """
+
+    __slots__ = ("_builder", "_states", "_deps", "_cached")
+
+    def __init__(self, builder: Callable[[], Any], states: tuple = ()):
+        """
+        Initialize a Memo wrapping a builder function.
+
+        Args:
+            builder: Zero-argument function producing the value to cache
+            states: Extra State objects to track in addition to the ones
+                read while the builder runs
+        """
+        self._builder = builder
+        self._states = tuple(states)
+        self._deps = None
+        self._cached: Any = None
+
+    def __call__(self) -> Any:
+        """
+        Return the cached result, rebuilding it if a dependency changed.
+
+        Returns:
+            The builder's (possibly cached) result
+        """
+        deps = self._deps
+        if deps is not None:
+            for state, value in deps:
+                if state._value != value:
+                    break
+            else:
+                return self._cached
+
+        frames = getattr(_tracking, "frames", None)
+        if frames is None:
+            frames = _tracking.frames = []
+        frame = set(self._states)
+        frames.append(frame)
+        try:
+            result = self._builder()
+        finally:
+            frames.pop()
+
+        self._deps = tuple((state, state._value) for state in frame)
+        self._cached = result
+        return result
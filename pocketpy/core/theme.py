@@ -5,11 +5,32 @@ Provides color schemes, typography, spacing, and styling constants
 for building beautiful, consistent UIs.
 """
 
+import sys
+from functools import lru_cache
 from typing import Dict, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 
-@dataclass
+@lru_cache(maxsize=512)
+def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """
+    Parse a hex color string into an RGB tuple, cached per unique string.
+
+    A frame hits the same handful of theme colors thousands of times;
+    parsing each distinct string once per process makes the common case
+    a single dict lookup.
+
+    Args:
+        hex_color: Hex color string like "#FF0000"
+
+    Returns:
+        RGB tuple (r, g, b)
+    """
+    h = hex_color.lstrip('#')
+    return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16))
+
+
+@dataclass(slots=True, frozen=True)
 class ColorScheme:
     """Color scheme for light or dark mode"""
     
@@ -53,7 +74,7 @@ class ColorScheme:
     shadow: str = "#00000020"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Typography:
     """Typography scale and font definitions"""
     
@@ -85,7 +106,7 @@ class Typography:
     line_height_relaxed: float = 1.75
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Spacing:
     """Spacing scale for consistent layouts"""
     
@@ -118,7 +139,7 @@ class Spacing:
     radius_full: int = 9999
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Shadows:
     """Shadow definitions for depth and elevation"""
     
@@ -133,7 +154,7 @@ class Shadows:
     shadow_2xl: Tuple[int, int, int] = (0, 12, 24)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Animation:
     """Animation timing and easing configurations"""
     
@@ -150,6 +171,76 @@ class Animation:
     easing_spring: str = "spring"
 
 
+# Per-mode color schemes, built once at import. The factory classmethods
+# reuse these instead of re-running dozens of dataclass field writes on
+# every call.
+_LIGHT_COLORS = ColorScheme(
+    primary="#007AFF",
+    background="#F2F2F7",
+    surface="#FFFFFF",
+    card="#FFFFFF",
+    text_primary="#000000",
+    text_secondary="#3C3C43",
+    border="#C6C6C8"
+)
+
+_DARK_COLORS = ColorScheme(
+    primary="#0A84FF",
+    primary_dark="#006DD9",
+    primary_light="#409CFF",
+    background="#000000",
+    surface="#1C1C1E",
+    card="#2C2C2E",
+    border="#38383A",
+    divider="#3A3A3C",
+    text_primary="#FFFFFF",
+    text_secondary="#EBEBF5",
+    text_tertiary="#EBEBF599",
+    text_disabled="#545456",
+    hover="#2C2C2E",
+    active="#3A3A3C",
+    disabled_bg="#3A3A3C",
+    overlay="#000000AA",
+    shadow="#00000040"
+)
+
+_MATERIAL_COLORS = ColorScheme(
+    primary="#6200EE",
+    primary_dark="#3700B3",
+    primary_light="#BB86FC",
+    secondary="#03DAC6",
+    secondary_dark="#018786",
+    secondary_light="#66FFF9",
+    background="#FFFFFF",
+    surface="#FFFFFF",
+    error="#B00020",
+    text_primary="#000000DE",
+    text_secondary="#00000099",
+    text_tertiary="#00000061"
+)
+
+_MATERIAL_SPACING = Spacing(
+    padding_button=(10, 16),
+    radius_sm=4,
+    radius_md=4,
+    radius_lg=8
+)
+
+_MATERIAL_DARK_COLORS = ColorScheme(
+    primary="#BB86FC",
+    primary_dark="#3700B3",
+    primary_light="#E1BEE7",
+    secondary="#03DAC6",
+    background="#121212",
+    surface="#1E1E1E",
+    card="#2C2C2C",
+    border="#424242",
+    text_primary="#FFFFFF",
+    text_secondary="#FFFFFFB3",
+    text_tertiary="#FFFFFF80"
+)
+
+
 class Theme:
     """
     Complete theme configuration for PocketPy apps.
@@ -195,112 +286,79 @@ class Theme:
         self.spacing = spacing or Spacing()
         self.shadows = shadows or Shadows()
         self.animation = animation or Animation()
+
+        # Flattened "namespace.field" -> value map: hot style paths can
+        # resolve a property with one dict probe instead of two chained
+        # attribute lookups (theme.colors.primary)
+        self._flat = {
+            f"{ns}.{k}": v
+            for ns, obj in (("colors", self.colors),
+                            ("typography", self.typography),
+                            ("spacing", self.spacing))
+            for k, v in asdict(obj).items()
+        }
+
+    def get(self, key: str, default=None):
+        """
+        Look up a theme property through the flattened map.
+
+        Args:
+            key: Dotted property name, e.g. "colors.primary"
+            default: Value returned when the key is unknown
+
+        Returns:
+            The property value, or the default
+        """
+        return self._flat.get(key, default)
     
     @classmethod
+    @lru_cache(maxsize=None)
     def light(cls) -> "Theme":
-        """Create a light theme (iOS-inspired)"""
-        colors = ColorScheme(
-            primary="#007AFF",
-            background="#F2F2F7",
-            surface="#FFFFFF",
-            card="#FFFFFF",
-            text_primary="#000000",
-            text_secondary="#3C3C43",
-            border="#C6C6C8"
-        )
-        return cls(colors=colors, mode="light")
-    
+        """Create a light theme (iOS-inspired), cached per class"""
+        return cls(colors=_LIGHT_COLORS, mode="light")
+
     @classmethod
+    @lru_cache(maxsize=None)
     def dark(cls) -> "Theme":
-        """Create a dark theme (iOS-inspired)"""
-        colors = ColorScheme(
-            primary="#0A84FF",
-            primary_dark="#006DD9",
-            primary_light="#409CFF",
-            background="#000000",
-            surface="#1C1C1E",
-            card="#2C2C2E",
-            border="#38383A",
-            divider="#3A3A3C",
-            text_primary="#FFFFFF",
-            text_secondary="#EBEBF5",
-            text_tertiary="#EBEBF599",
-            text_disabled="#545456",
-            hover="#2C2C2E",
-            active="#3A3A3C",
-            disabled_bg="#3A3A3C",
-            overlay="#000000AA",
-            shadow="#00000040"
-        )
-        return cls(colors=colors, mode="dark")
-    
+        """Create a dark theme (iOS-inspired), cached per class"""
+        return cls(colors=_DARK_COLORS, mode="dark")
+
     @classmethod
+    @lru_cache(maxsize=None)
     def material(cls) -> "Theme":
-        """Create a Material Design theme"""
-        colors = ColorScheme(
-            primary="#6200EE",
-            primary_dark="#3700B3",
-            primary_light="#BB86FC",
-            secondary="#03DAC6",
-            secondary_dark="#018786",
-            secondary_light="#66FFF9",
-            background="#FFFFFF",
-            surface="#FFFFFF",
-            error="#B00020",
-            text_primary="#000000DE",
-            text_secondary="#00000099",
-            text_tertiary="#00000061"
-        )
-        
-        spacing = Spacing(
-            padding_button=(10, 16),
-            radius_sm=4,
-            radius_md=4,
-            radius_lg=8
-        )
-        
-        return cls(colors=colors, spacing=spacing, mode="light")
-    
+        """Create a Material Design theme, cached per class"""
+        return cls(colors=_MATERIAL_COLORS, spacing=_MATERIAL_SPACING,
+                   mode="light")
+
     @classmethod
+    @lru_cache(maxsize=None)
     def material_dark(cls) -> "Theme":
-        """Create a Material Design dark theme"""
-        colors = ColorScheme(
-            primary="#BB86FC",
-            primary_dark="#3700B3",
-            primary_light="#E1BEE7",
-            secondary="#03DAC6",
-            background="#121212",
-            surface="#1E1E1E",
-            card="#2C2C2C",
-            border="#424242",
-            text_primary="#FFFFFF",
-            text_secondary="#FFFFFFB3",
-            text_tertiary="#FFFFFF80"
-        )
-        
-        return cls(colors=colors, mode="dark")
+        """Create a Material Design dark theme, cached per class"""
+        return cls(colors=_MATERIAL_DARK_COLORS, mode="dark")
     
-    def hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
+    def hex_to_rgb(self, hex_color) -> Tuple[int, int, int]:
         """
         Convert hex color to RGB tuple.
-        
+
         Args:
-            hex_color: Hex color string like "#FF0000"
-            
+            hex_color: Hex color string like "#FF0000", or an already
+                parsed RGB tuple (returned as-is)
+
         Returns:
             RGB tuple (r, g, b)
         """
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-    
-    def rgba_to_tuple(self, hex_color: str, alpha: int = 255) -> Tuple[int, int, int, int]:
+        if isinstance(hex_color, tuple):
+            return hex_color
+        return _hex_to_rgb(hex_color)
+
+    def rgba_to_tuple(self, hex_color, alpha: int = 255) -> Tuple[int, int, int, int]:
         """
         Convert hex color to RGBA tuple.
-        
+
         Args:
-            hex_color: Hex color string
+            hex_color: Hex color string or parsed RGB tuple
             alpha: Alpha value (0-255)
-            
+
         Returns:
             RGBA tuple (r, g, b, a)
         """
@@ -311,3 +369,16 @@ class Theme:
 # Default themes
 DEFAULT_LIGHT_THEME = Theme.light()
 DEFAULT_DARK_THEME = Theme.dark()
+
+
+# Interned color constants shared across the framework and examples.
+# Passing these by reference avoids re-allocating the same hex literals on
+# every rebuild and lets identity-based caches short-circuit comparisons.
+COLOR_PRIMARY = sys.intern("#007AFF")
+COLOR_SUCCESS = sys.intern("#34C759")
+COLOR_DANGER = sys.intern("#FF3B30")
+COLOR_GRAY = sys.intern("#8E8E93")
+COLOR_TEXT = sys.intern("#000000")
+COLOR_TEXT_SECONDARY = sys.intern("#3C3C43")
+COLOR_WHITE = sys.intern("#FFFFFF")
+COLOR_BACKGROUND = sys.intern("#F2F2F7")
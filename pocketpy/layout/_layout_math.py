@@ -0,0 +1,31 @@
+"""
+Shared layout arithmetic helpers
+"""
+
+from itertools import accumulate
+
+# Below this many children the inline bytecode loop wins; above it the
+# list building is amortized and accumulate's C loop pays off
+BULK_THRESHOLD = 64
+
+
+def cumulative_offsets(sizes: list, spacing: float, origin: float) -> list:
+    """
+    Compute running main-axis offsets for a row or column of children.
+
+    The cumulative sum runs inside ``itertools.accumulate``'s C loop
+    instead of bytecode, so the per-child arithmetic for long lists
+    never touches the interpreter.
+
+    Args:
+        sizes: Per-child main-axis sizes (None treated as 0)
+        spacing: Gap inserted after each child
+        origin: Main-axis coordinate of the first child
+
+    Returns:
+        A list of offsets, one per child, starting at origin
+    """
+    steps = [(size or 0) + spacing for size in sizes]
+    offsets = list(accumulate(steps, initial=origin))
+    offsets.pop()
+    return offsets
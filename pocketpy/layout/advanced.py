@@ -2,10 +2,85 @@
 Advanced layout widgets: Grid, Stack, Spacer, Divider
 """
 
+from functools import lru_cache
+from sys import intern
 from typing import Optional, List
 from pocketpy.widgets.base import Widget
 
 
+@lru_cache(maxsize=256)
+def _spacer_dict(width, height, flex, pos) -> dict:
+    """
+    Shared build dict for spacers with identical inputs.
+
+    Spacers are pure geometry: two spacers with the same fields render
+    identically, so every instance can hand out the same dict. Safe to
+    share because nothing downstream writes into spacer dicts.
+    """
+    return {
+        "type": "spacer",
+        "width": width,
+        "height": height,
+        "flex": flex,
+        "position": pos
+    }
+
+
+@lru_cache(maxsize=256)
+def _divider_dict(orientation, thickness, color, length, margin,
+                  pos) -> dict:
+    """
+    Shared build dict for dividers with identical inputs.
+    """
+    return {
+        "type": "divider",
+        "orientation": orientation,
+        "thickness": thickness,
+        "color": color,
+        "length": length,
+        "margin": margin,
+        "position": pos
+    }
+
+# Only cull when the content is big enough for the scan to pay for
+# itself; short lists render faster than they filter
+_CULL_THRESHOLD = 32
+
+
+def _visible_children(children: list, ox: int, oy: int,
+                      vw: int, vh: int) -> list:
+    """
+    Filter built child dicts to those intersecting the viewport.
+
+    Children without a position, or without a known size, are kept: the
+    cull only drops what is provably outside.
+
+    Args:
+        children: Built child dicts (each may carry position/width/height)
+        ox: Viewport origin x (scroll offset applied)
+        oy: Viewport origin y
+        vw: Viewport width
+        vh: Viewport height
+
+    Returns:
+        The children that may be visible, in order
+    """
+    out = []
+    append = out.append
+    right = ox + vw
+    bottom = oy + vh
+    for child in children:
+        pos = child.get("position")
+        if pos is None:
+            append(child)
+            continue
+        cx, cy = pos
+        if (cx + (child.get("width") or 0) >= ox and cx <= right and
+                cy + (child.get("height") or 0) >= oy and cy <= bottom):
+            append(child)
+    return out
+
+
 class Grid(Widget):
     """
     A grid layout container.
@@ -44,9 +119,8 @@ class Grid(Widget):
             background_color: Background color
             **kwargs: Additional styling properties
         """
-        super().__init__(**kwargs)
-        
-        self.children = children or []
+        super().__init__(children=children, **kwargs)
+
         self.columns = columns
         self.rows = rows
         self.spacing = spacing
@@ -54,25 +128,86 @@ class Grid(Widget):
         self.row_spacing = row_spacing if row_spacing is not None else spacing
         self.grid_padding = padding
         self.background_color = background_color
-    
-    def build(self) -> dict:
+        self._cached_build: Optional[dict] = None
+        self._build_key = None
+        self._layout_key = None
+
+    def _build_impl(self) -> dict:
         """Build the grid's visual representation"""
+        # Position children in row-major cells before building them, so
+        # their dicts carry the right coordinates. The column x offsets
+        # are precomputed once per row of cells rather than re-derived
+        # per child, and the whole pass is skipped when nothing
+        # geometric changed (same scheme as VBox._layout_key).
+        children = self.children
+        if children:
+            columns = self.columns or 1
+            pad = self.grid_padding
+            if isinstance(pad, tuple):
+                pad_top = pad[0]
+                pad_left = pad[1] if len(pad) > 1 else pad[0]
+            else:
+                pad_top = pad_left = pad
+            layout_key = (self.x, self.y, columns, self.column_spacing,
+                          self.row_spacing, pad_top, pad_left,
+                          tuple((id(child), child.width, child.height)
+                                for child in children))
+            if layout_key != self._layout_key:
+                cell_w = max((child.width or 0) for child in children)
+                cell_h = max((child.height or 0) for child in children)
+                col_xs = [self.x + pad_left +
+                          col * (cell_w + self.column_spacing)
+                          for col in range(columns)]
+                row_step = cell_h + self.row_spacing
+                current_y = self.y + pad_top
+                col = 0
+                for child in children:
+                    child.x = col_xs[col]
+                    child.y = int(current_y)
+                    col += 1
+                    if col == columns:
+                        col = 0
+                        current_y += row_step
+                self._layout_key = layout_key
+
         built_children = [child.build() for child in self.children]
-        
-        return {
+
+        # Hoist attribute reads into locals: each feeds both the cache
+        # key and the dict, costing one LOAD_ATTR instead of two
+        x, y = self.x, self.y
+        pos = self._pos
+        width, height = self.width, self.height
+        columns, rows = self.columns, self.rows
+        column_spacing, row_spacing = self.column_spacing, self.row_spacing
+        padding = self.grid_padding
+        background_color = self.background_color
+        margin = self.margin
+
+        # Reuse the previous dict when nothing fed into it changed; the
+        # key covers every mutable input, same idea as VBox._layout_key
+        key = (x, y, width, height, columns, rows, column_spacing,
+               row_spacing, padding, background_color, margin,
+               tuple(map(id, built_children)))
+        if key == self._build_key:
+            return self._cached_build
+
+        out = {
             "type": "grid",
             "children": built_children,
-            "columns": self.columns,
-            "rows": self.rows,
-            "column_spacing": self.column_spacing,
-            "row_spacing": self.row_spacing,
-            "padding": self.grid_padding,
-            "background_color": self.background_color,
-            "width": self.width,
-            "height": self.height,
-            "margin": self.margin,
-            "position": (self.x, self.y)
+            "columns": columns,
+            "rows": rows,
+            "column_spacing": column_spacing,
+            "row_spacing": row_spacing,
+            "padding": padding,
+            "background_color": background_color,
+            "width": width,
+            "height": height,
+            "margin": margin,
+            "position": pos
         }
+        self._build_key = key
+        self._cached_build = out
+        return out
 
 
 class Stack(Widget):
@@ -105,24 +240,39 @@ class Stack(Widget):
             alignment: How to align children
             **kwargs: Additional styling properties
         """
-        super().__init__(**kwargs)
-        
-        self.children = children or []
-        self.alignment = alignment
-    
-    def build(self) -> dict:
+        super().__init__(children=children, **kwargs)
+
+        self.alignment = intern(alignment)
+        self._cached_build: Optional[dict] = None
+        self._build_key = None
+
+    def _build_impl(self) -> dict:
         """Build the stack's visual representation"""
         built_children = [child.build() for child in self.children]
-        
-        return {
+
+        x, y = self.x, self.y
+        pos = self._pos
+        width, height = self.width, self.height
+        alignment = self.alignment
+        margin = self.margin
+
+        key = (x, y, width, height, alignment, margin,
+               tuple(map(id, built_children)))
+        if key == self._build_key:
+            return self._cached_build
+
+        out = {
             "type": "stack",
             "children": built_children,
-            "alignment": self.alignment,
-            "width": self.width,
-            "height": self.height,
-            "margin": self.margin,
-            "position": (self.x, self.y)
+            "alignment": alignment,
+            "width": width,
+            "height": height,
+            "margin": margin,
+            "position": pos
         }
+        self._build_key = key
+        self._cached_build = out
+        return out
 
 
 class Spacer(Widget):
@@ -159,16 +309,12 @@ class Spacer(Widget):
         self.spacer_width = width
         self.spacer_height = height
         self.flex = flex
-    
-    def build(self) -> dict:
+
+    def _build_impl(self) -> dict:
         """Build the spacer's visual representation"""
-        return {
-            "type": "spacer",
-            "width": self.spacer_width,
-            "height": self.spacer_height,
-            "flex": self.flex,
-            "position": (self.x, self.y)
-        }
+        # All inputs are hashable scalars; equal spacers share one dict
+        return _spacer_dict(self.spacer_width, self.spacer_height,
+                            self.flex, self._pos)
 
 
 class Divider(Widget):
@@ -207,18 +353,12 @@ class Divider(Widget):
         self.thickness = thickness
         self.divider_color = color
         self.length = length
-    
-    def build(self) -> dict:
+
+    def _build_impl(self) -> dict:
         """Build the divider's visual representation"""
-        return {
-            "type": "divider",
-            "orientation": self.orientation,
-            "thickness": self.thickness,
-            "color": self.divider_color,
-            "length": self.length,
-            "margin": self.margin,
-            "position": (self.x, self.y)
-        }
+        return _divider_dict(self.orientation, self.thickness,
+                             self.divider_color, self.length,
+                             self.margin, self._pos)
 
 
 class ScrollView(Widget):
@@ -256,26 +396,75 @@ class ScrollView(Widget):
         
         self._scroll_offset_x = 0
         self._scroll_offset_y = 0
-    
+        self._cached_build: Optional[dict] = None
+        self._build_key = None
+        # Keeps the uncull'd child dict alive so its id in _build_key
+        # stays unambiguous
+        self._last_child_build: Optional[dict] = None
+
     def scroll(self, dx: int, dy: int) -> None:
         """Scroll by delta"""
+        if not dx and not dy:
+            return
         self._scroll_offset_x += dx
         self._scroll_offset_y += dy
         self._trigger_rebuild()
-    
-    def build(self) -> dict:
+
+    def _needs_build(self) -> bool:
+        """
+        Check this subtree for dirtiness, including the scroll child.
+
+        The scrollable content hangs off ``child`` rather than the
+        ``children`` list the base walk covers.
+        """
+        if self._dirty:
+            return True
+        child = self.child
+        return child is not None and child._needs_build()
+
+    def _build_impl(self) -> dict:
         """Build the scroll view's visual representation"""
         built_child = self.child.build() if self.child else {}
-        
-        return {
+
+        x, y = self.x, self.y
+        pos = self._pos
+        width, height = self.width, self.height
+        scroll_direction = self.scroll_direction
+        show_scrollbar = self.show_scrollbar
+        margin = self.margin
+        offset_x, offset_y = self._scroll_offset_x, self._scroll_offset_y
+
+        key = (x, y, width, height, scroll_direction, show_scrollbar,
+               margin, offset_x, offset_y, id(built_child))
+        if key == self._build_key:
+            return self._cached_build
+        self._last_child_build = built_child
+
+        # Cull provably offscreen content: long lists are the whole
+        # point of a ScrollView, and most of them are outside the
+        # viewport at any one time
+        grandchildren = built_child.get("children") if built_child else None
+        if (grandchildren is not None and width is not None
+                and height is not None
+                and len(grandchildren) >= _CULL_THRESHOLD):
+            visible = _visible_children(grandchildren, x + offset_x,
+                                        y + offset_y, width, height)
+            if len(visible) != len(grandchildren):
+                built_child = dict(built_child)
+                built_child["children"] = visible
+
+        out = {
             "type": "scrollview",
             "child": built_child,
-            "scroll_direction": self.scroll_direction,
-            "show_scrollbar": self.show_scrollbar,
-            "scroll_offset": (self._scroll_offset_x, self._scroll_offset_y),
-            "width": self.width,
-            "height": self.height,
-            "margin": self.margin,
-            "position": (self.x, self.y),
+            "scroll_direction": scroll_direction,
+            "show_scrollbar": show_scrollbar,
+            "scroll_offset": (offset_x, offset_y),
+            "width": width,
+            "height": height,
+            "margin": margin,
+            "position": pos,
             "on_scroll": self.scroll
         }
+        self._build_key = key
+        self._cached_build = out
+        return out
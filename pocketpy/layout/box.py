@@ -0,0 +1,67 @@
+"""
+Shared base for the one-axis box containers
+"""
+
+from sys import intern
+from typing import List, Optional
+from pocketpy.widgets.base import Widget
+
+
+class Box(Widget):
+    """
+    Common machinery for HBox and VBox.
+
+    The two boxes differ only in which axis the running offset advances
+    on; everything else — construction, the layout-key skip and the
+    output dict — lives here. The per-axis positioning loops stay
+    hand-written in the subclasses so each one runs with constant
+    attribute names instead of dynamic axis indexing.
+    """
+
+    # Overridden by each subclass with its dict type tag
+    _type_tag = "box"
+
+    def __init__(
+        self,
+        children: Optional[List[Widget]] = None,
+        spacing: float = 0,
+        alignment: str = "start",
+        **kwargs
+    ):
+        """
+        Initialize a box layout container.
+
+        Args:
+            children: List of child widgets to arrange along the axis
+            spacing: Space between children (in pixels)
+            alignment: Cross-axis alignment ('start', 'center', 'end',
+                'stretch')
+            **kwargs: Additional styling properties
+        """
+        super().__init__(children=children, **kwargs)
+        self.spacing = spacing
+        self.alignment = intern(alignment)
+        self._layout_key = None
+
+    def _assemble(self, built_children: list) -> dict:
+        """
+        Produce the box's build dict around already-built children.
+
+        Args:
+            built_children: Child dicts in layout order
+
+        Returns:
+            Dictionary describing the layout
+        """
+        return {
+            "type": self._type_tag,
+            "children": built_children,
+            "spacing": self.spacing,
+            "alignment": self.alignment,
+            "width": self.width,
+            "height": self.height,
+            "background_color": self.background_color,
+            "padding": self.padding,
+            "margin": self.margin,
+            "position": self._pos
+        }
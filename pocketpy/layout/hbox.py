@@ -2,14 +2,14 @@
 Horizontal Box layout container
 """
 
-from typing import List, Optional
-from pocketpy.widgets.base import Widget
+from pocketpy.layout._layout_math import BULK_THRESHOLD, cumulative_offsets
+from pocketpy.layout.box import Box
 
 
-class HBox(Widget):
+class HBox(Box):
     """
     A horizontal layout container that arranges children in a row.
-    
+
     Example:
         >>> layout = HBox(
         ...     children=[
@@ -20,68 +20,46 @@ class HBox(Widget):
         ...     spacing=10
         ... )
     """
-    
-    def __init__(
-        self,
-        children: Optional[List[Widget]] = None,
-        spacing: float = 0,
-        alignment: str = "start",
-        **kwargs
-    ):
-        """
-        Initialize an HBox layout container.
-        
-        Args:
-            children: List of child widgets to arrange horizontally
-            spacing: Space between children (in pixels)
-            alignment: Vertical alignment ('start', 'center', 'end', 'stretch')
-            **kwargs: Additional styling properties
-        """
-        super().__init__(children=children, **kwargs)
-        self.spacing = spacing
-        self.alignment = alignment
-    
-    def build(self) -> dict:
+
+    _type_tag = "hbox"
+
+    def _build_impl(self) -> dict:
         """
         Build the HBox layout.
-        
+
         Returns:
             Dictionary describing the layout
         """
-        # Calculate positions for children
-        current_x = self.x
-        pad_top = 0
-        pad_left = 0
-        
-        if self.padding:
-            if isinstance(self.padding, (int, float)):
-                pad_top = pad_left = self.padding
-            elif isinstance(self.padding, tuple) and len(self.padding) >= 2:
-                pad_top = self.padding[0]
-                pad_left = self.padding[1]
-            elif isinstance(self.padding, tuple) and len(self.padding) == 1:
-                pad_top = pad_left = self.padding[0]
-        
-        current_x += pad_left
-        
-        for child in self.children:
-            # Set child position
-            child.x = int(current_x)
-            child.y = self.y + pad_top
-            
-            # Calculate next X position
-            child_width = child.width or 0
-            current_x += child_width + self.spacing
-        
-        return {
-            "type": "hbox",
-            "children": [child.build() for child in self.children],
-            "spacing": self.spacing,
-            "alignment": self.alignment,
-            "width": self.width,
-            "height": self.height,
-            "background_color": self.background_color,
-            "padding": self.padding,
-            "margin": self.margin,
-            "position": (self.x, self.y)
-        }
+        # Calculate positions for children; padding is one packed int
+        pad = self._pad
+        pad_top = (pad >> 16) & 0xFF
+        pad_left = pad & 0xFF
+
+        # Skip the positioning pass when nothing geometric changed since
+        # the last build (same origin, spacing, padding and child sizes)
+        key = (self.x, self.y, self.spacing, pad,
+               tuple((id(child), child.width) for child in self.children))
+        if key != self._layout_key:
+            # Running cumulative sum with everything loop-invariant
+            # hoisted: the row y and spacing are read once, not per child.
+            # Long rows hand the arithmetic to the C-level accumulate
+            # kernel instead of running it in bytecode.
+            children = self.children
+            child_y = self.y + pad_top
+            spacing = self.spacing
+            if len(children) >= BULK_THRESHOLD:
+                xs = cumulative_offsets(
+                    [child.width for child in children],
+                    spacing, self.x + pad_left)
+                for child, child_x in zip(children, xs):
+                    child.x = int(child_x)
+                    child.y = child_y
+            else:
+                current_x = self.x + pad_left
+                for child in children:
+                    child.x = int(current_x)
+                    child.y = child_y
+                    current_x += (child.width or 0) + spacing
+            self._layout_key = key
+
+        return self._assemble([child.build() for child in self.children])
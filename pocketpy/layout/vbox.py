@@ -2,14 +2,14 @@
 Vertical Box layout container
 """
 
-from typing import List, Optional
-from pocketpy.widgets.base import Widget
+from pocketpy.layout._layout_math import BULK_THRESHOLD, cumulative_offsets
+from pocketpy.layout.box import Box
 
 
-class VBox(Widget):
+class VBox(Box):
     """
     A vertical layout container that arranges children in a column.
-    
+
     Example:
         >>> layout = VBox(
         ...     children=[
@@ -20,68 +20,46 @@ class VBox(Widget):
         ...     spacing=10
         ... )
     """
-    
-    def __init__(
-        self,
-        children: Optional[List[Widget]] = None,
-        spacing: float = 0,
-        alignment: str = "start",
-        **kwargs
-    ):
-        """
-        Initialize a VBox layout container.
-        
-        Args:
-            children: List of child widgets to arrange vertically
-            spacing: Space between children (in pixels)
-            alignment: Horizontal alignment ('start', 'center', 'end', 'stretch')
-            **kwargs: Additional styling properties
-        """
-        super().__init__(children=children, **kwargs)
-        self.spacing = spacing
-        self.alignment = alignment
-    
-    def build(self) -> dict:
+
+    _type_tag = "vbox"
+
+    def _build_impl(self) -> dict:
         """
         Build the VBox layout.
-        
+
         Returns:
             Dictionary describing the layout
         """
-        # Calculate positions for children
-        current_y = self.y
-        pad_top = 0
-        pad_left = 0
-        
-        if self.padding:
-            if isinstance(self.padding, (int, float)):
-                pad_top = pad_left = self.padding
-            elif isinstance(self.padding, tuple) and len(self.padding) >= 2:
-                pad_top = self.padding[0]
-                pad_left = self.padding[1]
-            elif isinstance(self.padding, tuple) and len(self.padding) == 1:
-                pad_top = pad_left = self.padding[0]
-        
-        current_y += pad_top
-        
-        for child in self.children:
-            # Set child position
-            child.x = self.x + pad_left
-            child.y = int(current_y)
-            
-            # Calculate next Y position
-            child_height = child.height or 0
-            current_y += child_height + self.spacing
-        
-        return {
-            "type": "vbox",
-            "children": [child.build() for child in self.children],
-            "spacing": self.spacing,
-            "alignment": self.alignment,
-            "width": self.width,
-            "height": self.height,
-            "background_color": self.background_color,
-            "padding": self.padding,
-            "margin": self.margin,
-            "position": (self.x, self.y)
-        }
+        # Calculate positions for children; padding is one packed int
+        pad = self._pad
+        pad_top = (pad >> 16) & 0xFF
+        pad_left = pad & 0xFF
+
+        # Skip the positioning pass when nothing geometric changed since
+        # the last build (same origin, spacing, padding and child sizes)
+        key = (self.x, self.y, self.spacing, pad,
+               tuple((id(child), child.height) for child in self.children))
+        if key != self._layout_key:
+            # Running cumulative sum with everything loop-invariant
+            # hoisted: the column x and spacing are read once per pass.
+            # Long columns hand the arithmetic to the C-level accumulate
+            # kernel instead of running it in bytecode.
+            children = self.children
+            child_x = self.x + pad_left
+            spacing = self.spacing
+            if len(children) >= BULK_THRESHOLD:
+                ys = cumulative_offsets(
+                    [child.height for child in children],
+                    spacing, self.y + pad_top)
+                for child, child_y in zip(children, ys):
+                    child.x = child_x
+                    child.y = int(child_y)
+            else:
+                current_y = self.y + pad_top
+                for child in children:
+                    child.x = child_x
+                    child.y = int(current_y)
+                    current_y += (child.height or 0) + spacing
+            self._layout_key = key
+
+        return self._assemble([child.build() for child in self.children])
@@ -3,10 +3,27 @@ Base Widget class for PocketPy framework
 All UI components inherit from this class
 """
 
+from sys import intern
 from typing import Any, List, Optional, Callable
+from weakref import ref as _weakref
 from abc import ABC, abstractmethod
 from pocketpy.core.state import State
 
+# Shared sentinel for "no children": leaf widgets are the common case,
+# and every one of them sharing this tuple skips a list allocation
+_EMPTY: tuple = ()
+
+
+def _noop(*_args: Any) -> None:
+    """Do-nothing callback installed where no handler was given, so hot
+    event paths can call unconditionally instead of branching on None."""
+
+
+def _clamp16(value: int) -> int:
+    """Clamp a padding/margin component to the packable 0-65535 range,
+    rather than masking it into silent wraparound."""
+    return 0 if value < 0 else (0xFFFF if value > 0xFFFF else value)
+
 
 class Widget(ABC):
     """
@@ -21,7 +38,23 @@ class Widget(ABC):
         ...     def build(self):
         ...         return {"type": "button", "text": "Click Me"}
     """
-    
+
+    # Upper bound on each concrete class's free-list (see _release)
+    _POOL_CAP = 256
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "Widget":
+        """
+        Reuse a pooled instance of this class when one is available.
+
+        Rebuilds churn through many short-lived widgets; recycled
+        instances skip the allocator entirely and are fully
+        re-initialized by __init__.
+        """
+        pool = cls.__dict__.get("_pool")
+        if pool:
+            return pool.pop()
+        return super().__new__(cls)
+
     def __init__(
         self,
         children: Optional[List["Widget"]] = None,
@@ -44,14 +77,18 @@ class Widget(ABC):
             margin: Margin as (vertical, horizontal) or (top, right, bottom, left)
             **kwargs: Additional widget-specific properties
         """
-        self.children: List[Widget] = children or []
+        self.children: List[Widget] = children or _EMPTY
         self.parent: Optional[Widget] = None
         
         # Styling properties
         self.width = width
         self.height = height
-        self.background_color = background_color
-        self.padding = padding or (0, 0)
+        # Intern style strings so identical values share one object and
+        # downstream comparisons hit pointer equality first
+        self.background_color = (intern(background_color)
+                                 if isinstance(background_color, str)
+                                 else background_color)
+        self.padding = padding or (0, 0)  # packed by the property setter
         self.margin = margin or (0, 0)
         
         # Additional properties
@@ -60,54 +97,254 @@ class Widget(ABC):
         # Internal state
         self._mounted = False
         self._subscriptions: List[Callable[[], None]] = []
-        
-        # Position (calculated during layout)
-        self.x = 0
-        self.y = 0
+
+        # Build cache: build() returns _built until something in this
+        # subtree is marked dirty
+        self._dirty = True
+        self._built: Optional[Any] = None
+
+        # Position (calculated during layout); set via the x/y
+        # properties so moves invalidate the build cache. _pos is the
+        # same point as one reusable tuple, refreshed only on moves, so
+        # builds never allocate a position tuple for a widget that
+        # stayed put
+        self._x = 0
+        self._y = 0
+        self._pos = (0, 0)
+
+    @property
+    def x(self) -> int:
+        """Horizontal position, assigned during layout."""
+        return self._x
+
+    @x.setter
+    def x(self, value) -> None:
+        if value != self._x:
+            self._x = value
+            self._pos = (value, self._y)
+            self._dirty = True
+
+    @property
+    def y(self) -> int:
+        """Vertical position, assigned during layout."""
+        return self._y
+
+    @y.setter
+    def y(self, value) -> None:
+        if value != self._y:
+            self._y = value
+            self._pos = (self._x, value)
+            self._dirty = True
     
-    @abstractmethod
+    @property
+    def padding(self) -> tuple:
+        """
+        Padding as a (vertical, horizontal) tuple.
+
+        Stored internally as one packed int (`_pad`) so layout code can
+        read both components with shifts instead of tuple unpacking.
+
+        Returns:
+            (vertical, horizontal) padding tuple
+        """
+        pad = self._pad
+        return (pad >> 16, pad & 0xFFFF)
+
+    @padding.setter
+    def padding(self, value) -> None:
+        """
+        Pack padding into a single int.
+
+        Components are clamped to 0-65535; negative padding is not a
+        thing and 16 bits comfortably exceeds any screen dimension.
+
+        Args:
+            value: An int (uniform), a (vertical, horizontal) tuple, or a
+                1-tuple applied to both axes
+        """
+        if isinstance(value, (int, float)):
+            pad_y = pad_x = int(value)
+        elif value:
+            pad_y = int(value[0])
+            pad_x = int(value[1]) if len(value) > 1 else pad_y
+        else:
+            pad_y = pad_x = 0
+        self._pad = _clamp16(pad_y) << 16 | _clamp16(pad_x)
+
+    @property
+    def pad_y(self) -> int:
+        """Vertical padding component."""
+        return self._pad >> 16
+
+    @property
+    def pad_x(self) -> int:
+        """Horizontal padding component."""
+        return self._pad & 0xFFFF
+
+    @property
+    def margin(self) -> tuple:
+        """
+        Margin as a (vertical, horizontal) tuple.
+
+        Packed like padding (`_mrg`), so per-build consumers never
+        re-dispatch on the shape the caller passed in.
+
+        Returns:
+            (vertical, horizontal) margin tuple
+        """
+        mrg = self._mrg
+        return (mrg >> 16, mrg & 0xFFFF)
+
+    @margin.setter
+    def margin(self, value) -> None:
+        """
+        Pack margin into a single int.
+
+        Components are clamped to 0-65535, like padding.
+
+        Args:
+            value: An int (uniform), a (vertical, horizontal) tuple, or a
+                1-tuple applied to both axes
+        """
+        if isinstance(value, (int, float)):
+            mrg_y = mrg_x = int(value)
+        elif value:
+            mrg_y = int(value[0])
+            mrg_x = int(value[1]) if len(value) > 1 else mrg_y
+        else:
+            mrg_y = mrg_x = 0
+        self._mrg = _clamp16(mrg_y) << 16 | _clamp16(mrg_x)
+
+    @property
+    def mrg_y(self) -> int:
+        """Vertical margin component."""
+        return self._mrg >> 16
+
+    @property
+    def mrg_x(self) -> int:
+        """Horizontal margin component."""
+        return self._mrg & 0xFFFF
+
     def build(self) -> Any:
+        """
+        Build the widget's visual representation, cached while clean.
+
+        The subclass _build_impl runs only when this widget or something
+        below it has been marked dirty since the last build; otherwise
+        the previous dict is returned as-is, so an idle frame costs a
+        flag walk instead of rebuilding the whole tree.
+
+        Returns:
+            The widget's visual representation
+        """
+        if self._built is not None and not self._needs_build():
+            return self._built
+        out = self._build_impl()
+        self._built = out
+        self._dirty = False
+        return out
+
+    @abstractmethod
+    def _build_impl(self) -> Any:
         """
         Build the widget's visual representation.
-        
+
         This method must be implemented by all widget subclasses.
         It should return the widget's rendered output.
-        
+
         Returns:
             The widget's visual representation
         """
         pass
+
+    def _refresh_template(self) -> None:
+        """
+        Rebuild this widget's per-instance derived state, if it keeps any.
+
+        Widgets that precompute a ``_template`` or specialized accessor
+        closures override this to regenerate them from their current
+        attributes. The reconciler calls it after copying configuration
+        onto a retained widget, so templates and closures keep pointing
+        at the retained instance instead of the discarded duplicate.
+        """
+
+    def _needs_build(self) -> bool:
+        """
+        Check whether this subtree must be rebuilt.
+
+        Walks down rather than relying on upward dirty propagation, so
+        correctness does not depend on parent links being in place.
+
+        Returns:
+            True if this widget or any descendant is dirty
+        """
+        if self._dirty:
+            return True
+        for child in self.children:
+            if child._needs_build():
+                return True
+        return False
+
+    def _mark_dirty(self) -> None:
+        """
+        Mark this widget and its ancestors as needing a rebuild.
+
+        Stops as soon as an already-dirty ancestor is found; everything
+        above it was marked by an earlier call.
+        """
+        widget = self
+        while widget is not None and not widget._dirty:
+            widget._dirty = True
+            widget = widget.parent
     
     def mount(self) -> None:
         """
         Called when the widget is mounted to the UI tree.
         Override this method to perform initialization logic.
         """
-        self._mounted = True
-        
-        # Mount all children
-        for child in self.children:
-            child.parent = self
-            child.mount()
-    
+        # Iterative walk: one loop instead of a Python frame per node,
+        # which adds up on deep trees
+        stack = [self]
+        pop = stack.pop
+        push = stack.extend
+        while stack:
+            widget = pop()
+            widget._mounted = True
+            children = widget.children
+            if children:
+                for child in children:
+                    child.parent = widget
+                push(children)
+
     def unmount(self) -> None:
         """
         Called when the widget is removed from the UI tree.
         Override this method to perform cleanup logic.
         """
-        self._mounted = False
-        
-        # Unsubscribe from all state objects
-        self._cleanup_subscriptions()
-        
-        # Unmount all children
-        for child in self.children:
-            child.unmount()
+        stack = [self]
+        pop = stack.pop
+        push = stack.extend
+        while stack:
+            widget = pop()
+            widget._mounted = False
+
+            # Unsubscribe from all state objects
+            widget._cleanup_subscriptions()
+
+            if widget.children:
+                push(widget.children)
     
     def watch(self, state: State, callback: Optional[Callable[[], None]] = None) -> None:
         """
         Subscribe to a State object and trigger a rebuild when it changes.
-        
+
+        The State only holds a weak relay to the watcher, while this
+        widget keeps the real callback alive through _subscriptions.
+        Rebuilds churn through throwaway duplicates that also call
+        watch(); tying the subscription's lifetime to the widget means
+        a discarded tree's watchers are collected with it instead of
+        accumulating on the State forever.
+
         Args:
             state: The State object to watch
             callback: Optional callback to execute on state change (before rebuild)
@@ -115,12 +352,43 @@ class Widget(ABC):
         def on_change():
             if callback:
                 callback()
-            if self._mounted:
-                self._trigger_rebuild()
-        
-        state.subscribe(on_change)
-        self._subscriptions.append(lambda: state._listeners.remove(on_change))
+            self._mark_dirty()
+
+        target = _weakref(on_change)
+
+        def relay():
+            watcher = target()
+            if watcher is not None:
+                watcher()
+            else:
+                # The owning widget is gone; drop the dead entry.
+                # _notify iterates a snapshot, so this is safe mid-notify
+                state.unsubscribe(relay)
+
+        state.subscribe(relay)
+        # The default argument pins on_change (and thus the callback)
+        # for exactly as long as this widget holds the unsubscriber
+        self._subscriptions.append(
+            lambda _keep=on_change: state.unsubscribe(relay))
     
+    def _release(self) -> None:
+        """
+        Return this widget to its class's pool for reuse.
+
+        Only called by the reconciler for freshly built duplicates that
+        were never mounted and are not referenced elsewhere. The instance
+        dict is cleared so no stale state or references survive; the next
+        __init__ rebuilds it from scratch.
+        """
+        cls = type(self)
+        pool = cls.__dict__.get("_pool")
+        if pool is None:
+            pool = []
+            cls._pool = pool
+        if len(pool) < Widget._POOL_CAP:
+            self.__dict__.clear()
+            pool.append(self)
+
     def _cleanup_subscriptions(self) -> None:
         """
         Clean up all state subscriptions.
@@ -134,36 +402,90 @@ class Widget(ABC):
     
     def _trigger_rebuild(self) -> None:
         """
-        Trigger a rebuild of this widget.
-        This will be called when watched State objects change.
+        Queue a rebuild of this widget for the next frame.
+
+        Only marks the subtree dirty; the dirty walk stops at the first
+        already-dirty ancestor, so repeated triggers between two frames
+        are near-free. The actual build happens once, on the frame
+        loop's next build() traversal — however many watchers or events
+        fire on one State change, the tree is rebuilt a single time.
         """
-        # TODO: Implement rebuild/rerender logic
-        # For now, just call build to ensure the method works
-        self.build()
-    
+        self._mark_dirty()
+
+    # Kept as an alias: event handlers written against the explicit
+    # "defer to next frame" name keep working
+    _schedule_rebuild = _trigger_rebuild
+
+    def freeze(self) -> "Widget":
+        """
+        Lock this subtree's child lists after construction.
+
+        Declarative layouts rarely mutate their children once built;
+        converting the lists to tuples makes per-frame iteration
+        slightly cheaper and turns accidental mutation during build
+        into an immediate error instead of silent corruption.
+
+        Returns:
+            This widget, so freeze() can be chained onto a constructor
+        """
+        self.children = tuple(self.children)
+        for child in self.children:
+            child.freeze()
+        return self
+
     def add_child(self, child: "Widget") -> None:
         """
         Add a child widget.
-        
+
         Args:
             child: The child widget to add
+
+        Raises:
+            TypeError: If this widget has been frozen
         """
+        children = self.children
+        if children is _EMPTY:
+            # First child of a leaf-constructed widget: materialize the
+            # real list now
+            self.children = [child]
+        elif type(children) is tuple:
+            raise TypeError(
+                f"cannot add children to a frozen {self.__class__.__name__}"
+            )
+        else:
+            children.append(child)
         child.parent = self
-        self.children.append(child)
+        self._mark_dirty()
         if self._mounted:
             child.mount()
-    
+
     def remove_child(self, child: "Widget") -> None:
         """
         Remove a child widget.
-        
+
         Args:
             child: The child widget to remove
+
+        Raises:
+            TypeError: If this widget has been frozen
         """
-        if child in self.children:
-            child.unmount()
-            child.parent = None
-            self.children.remove(child)
+        # Single identity scan: membership test plus list.remove would
+        # walk the siblings twice, dispatching __eq__ each step
+        children = self.children
+        if not children:
+            return
+        if type(children) is tuple:
+            raise TypeError(
+                f"cannot remove children from a frozen "
+                f"{self.__class__.__name__}"
+            )
+        for i, existing in enumerate(children):
+            if existing is child:
+                child.unmount()
+                child.parent = None
+                children.pop(i)
+                self._mark_dirty()
+                return
     
     def __repr__(self) -> str:
         """
@@ -2,6 +2,8 @@
 Button widget for user interaction
 """
 
+import sys
+
 from typing import Optional, Callable
 from pocketpy.widgets.base import Widget
 from pocketpy.core.state import State
@@ -34,11 +36,13 @@ class Button(Widget):
         background_color: str = "#007AFF",
         hover_color: str = "#0051D5",
         disabled: bool = False,
+        user_data: Optional[object] = None,
+        antialias: bool = True,
         **kwargs
     ):
         """
         Initialize a Button widget.
-        
+
         Args:
             text: The button text (can be a string or State object)
             on_press: Callback function when button is pressed
@@ -48,6 +52,9 @@ class Button(Widget):
             background_color: Button background color
             hover_color: Background color when hovered
             disabled: Whether the button is disabled
+            user_data: Optional payload passed to on_press, letting many
+                buttons share one handler instead of per-item closures
+            antialias: Whether the button text is antialiased
             **kwargs: Additional styling properties
         """
         # Set default background color if not provided
@@ -56,41 +63,87 @@ class Button(Widget):
             
         super().__init__(**kwargs)
         
-        # Store the text (might be a State object)
+        # Store the text (might be a State object); the accessor is
+        # specialized by _refresh_template below
         self._text_source = text
         self.on_press = on_press
         self.font_size = font_size
-        self.font_family = font_family
-        self.color = color
-        self.hover_color = hover_color
+        # Intern style strings so repeated rebuilds share one object each
+        self.font_family = sys.intern(font_family)
+        self.color = sys.intern(color) if isinstance(color, str) else color
+        self.hover_color = (sys.intern(hover_color)
+                            if isinstance(hover_color, str) else hover_color)
         self.disabled = disabled
+        self.user_data = user_data
+        self.antialias = antialias
         
         # Internal state
         self._is_hovered = False
         self._is_pressed = False
-        
+
+        # Static half of the build dict, including the bound handlers so
+        # they are not re-created as method objects per build
+        self._refresh_template()
+
         # If text is a State object, watch it
         if isinstance(text, State):
             self.watch(text)
-    
+
+    def _bind_text_getter(self, source) -> None:
+        """
+        Specialize the text accessor for the source's type.
+
+        The State-or-string check runs once here instead of on every
+        text read; build() then calls a monomorphic closure.
+
+        Args:
+            source: The text string or State backing this button
+        """
+        if isinstance(source, State):
+            # Formatted is cached per value change on the State side
+            self._get_text = lambda s=source: s.formatted
+        else:
+            cached = source if type(source) is str else str(source)
+            self._get_text = lambda t=cached: t
+
+    def _refresh_template(self) -> None:
+        """Rewrite the derived text accessor and static build dict."""
+        self._bind_text_getter(self._text_source)
+        self._template = {
+            "type": "button",
+            "font_size": self.font_size,
+            "font_family": self.font_family,
+            "color": self.color,
+            "disabled": self.disabled,
+            "antialias": self.antialias,
+            "width": self.width,
+            "height": self.height,
+            "padding": self.padding or (10, 20),
+            "margin": self.margin,
+            "on_press": self.handle_press,
+            "on_hover_enter": self.handle_hover_enter,
+            "on_hover_exit": self.handle_hover_exit
+        }
+
     @property
     def text(self) -> str:
         """
         Get the current text value.
-        
+
         Returns:
             The text string
         """
-        if isinstance(self._text_source, State):
-            return str(self._text_source.value)
-        return str(self._text_source)
+        return self._get_text()
     
     def handle_press(self) -> None:
         """
         Handle button press event.
         """
         if not self.disabled and self.on_press:
-            self.on_press()
+            if self.user_data is not None:
+                self.on_press(self.user_data)
+            else:
+                self.on_press()
     
     def handle_hover_enter(self) -> None:
         """
@@ -107,10 +160,10 @@ class Button(Widget):
         self._is_hovered = False
         self._trigger_rebuild()
     
-    def build(self) -> dict:
+    def _build_impl(self) -> dict:
         """
         Build the button's visual representation.
-        
+
         Returns:
             Dictionary describing the button
         """
@@ -118,21 +171,9 @@ class Button(Widget):
         current_bg = self.background_color
         if self._is_hovered and not self.disabled:
             current_bg = self.hover_color
-        
-        return {
-            "type": "button",
-            "text": self.text,
-            "font_size": self.font_size,
-            "font_family": self.font_family,
-            "color": self.color,
-            "background_color": current_bg,
-            "disabled": self.disabled,
-            "width": self.width,
-            "height": self.height,
-            "padding": self.padding or (10, 20),
-            "margin": self.margin,
-            "position": (self.x, self.y),
-            "on_press": self.handle_press,
-            "on_hover_enter": self.handle_hover_enter,
-            "on_hover_exit": self.handle_hover_exit
-        }
+
+        d = self._template.copy()
+        d["text"] = self._get_text()
+        d["background_color"] = current_bg
+        d["position"] = self._pos
+        return d
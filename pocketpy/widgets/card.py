@@ -2,6 +2,7 @@
 Card widget for grouped content with elevation
 """
 
+from sys import intern
 from typing import Optional, List
 from pocketpy.widgets.base import Widget
 
@@ -42,29 +43,22 @@ class Card(Widget):
             padding: Internal padding
             **kwargs: Additional styling properties
         """
-        super().__init__(**kwargs)
-        
-        self.children = children or []
+        super().__init__(children=children, **kwargs)
+
         self.background_color = background_color
         self.border_color = border_color
         self.border_width = border_width
         self.border_radius = border_radius
-        self.elevation = elevation
+        self.elevation = intern(elevation)
         self.card_padding = padding
-        
-        # Watch all children
-        for child in self.children:
-            if hasattr(child, '_parent'):
-                child._parent = self
-    
-    def build(self) -> dict:
-        """Build the card's visual representation"""
-        # Build all children
-        built_children = [child.build() for child in self.children]
-        
-        return {
+
+        # Static half of the build dict
+        self._refresh_template()
+
+    def _refresh_template(self) -> None:
+        """Rewrite the static build dict from current attributes."""
+        self._template = {
             "type": "card",
-            "children": built_children,
             "background_color": self.background_color,
             "border_color": self.border_color,
             "border_width": self.border_width,
@@ -73,6 +67,12 @@ class Card(Widget):
             "padding": self.card_padding,
             "width": self.width,
             "height": self.height,
-            "margin": self.margin,
-            "position": (self.x, self.y)
+            "margin": self.margin
         }
+
+    def _build_impl(self) -> dict:
+        """Build the card's visual representation"""
+        d = self._template.copy()
+        d["children"] = [child.build() for child in self.children]
+        d["position"] = self._pos
+        return d
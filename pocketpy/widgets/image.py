@@ -2,6 +2,7 @@
 Image widget for displaying images
 """
 
+from sys import intern
 from typing import Optional
 from pocketpy.widgets.base import Widget
 
@@ -46,16 +47,19 @@ class Image(Widget):
         self.src = src
         self.img_width = width
         self.img_height = height
-        self.fit = fit
+        self.fit = intern(fit)
         self.border_radius = border_radius
         self.opacity = opacity
         
         self._image_loaded = False
         self._image_surface = None
-    
-    def build(self) -> dict:
-        """Build the image's visual representation"""
-        return {
+
+        # Static half of the build dict
+        self._refresh_template()
+
+    def _refresh_template(self) -> None:
+        """Rewrite the static build dict from current attributes."""
+        self._template = {
             "type": "image",
             "src": self.src,
             "width": self.img_width or self.width or 100,
@@ -63,7 +67,12 @@ class Image(Widget):
             "fit": self.fit,
             "border_radius": self.border_radius,
             "opacity": self.opacity,
-            "margin": self.margin,
-            "position": (self.x, self.y),
-            "_image_surface": self._image_surface
+            "margin": self.margin
         }
+
+    def _build_impl(self) -> dict:
+        """Build the image's visual representation"""
+        d = self._template.copy()
+        d["position"] = self._pos
+        d["_image_surface"] = self._image_surface
+        return d
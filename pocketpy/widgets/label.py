@@ -2,6 +2,8 @@
 Label widget for displaying text
 """
 
+import sys
+
 from typing import Optional
 from pocketpy.widgets.base import Widget
 from pocketpy.core.state import State
@@ -27,62 +29,117 @@ class Label(Widget):
         font_family: str = "sans-serif",
         color: str = "#000000",
         text_align: str = "left",
+        antialias: bool = True,
         **kwargs
     ):
         """
         Initialize a Label widget.
-        
+
         Args:
             text: The text to display (can be a string or State object)
             font_size: Size of the font
             font_family: Font family name
             color: Text color (hex string)
             text_align: Text alignment ('left', 'center', 'right')
+            antialias: Whether text is antialiased; disable for small
+                labels that redraw constantly (e.g. live counters)
             **kwargs: Additional styling properties
         """
         super().__init__(**kwargs)
         
-        # Store the text (might be a State object)
+        # Store the text (might be a State object); the accessor is
+        # specialized by _refresh_template below
         self._text_source = text
         self.font_size = font_size
-        self.font_family = font_family
-        self.color = color
-        self.text_align = text_align
-        
+        # Intern style strings so repeated rebuilds share one object each
+        self.font_family = sys.intern(font_family)
+        self.color = sys.intern(color) if isinstance(color, str) else color
+        self.text_align = sys.intern(text_align)
+        self.antialias = antialias
+
+        # Static half of the build dict; _build_impl copies it and
+        # fills in the two keys that actually vary
+        self._refresh_template()
+
         # If text is a State object, watch it
         if isinstance(text, State):
             self.watch(text)
-    
+
+    def _refresh_template(self) -> None:
+        """Rewrite the derived text accessor and static build dict."""
+        self._bind_text_getter(self._text_source)
+        self._template = {
+            "type": "label",
+            "font_size": self.font_size,
+            "font_family": self.font_family,
+            "color": self.color,
+            "text_align": self.text_align,
+            "antialias": self.antialias,
+            "width": self.width,
+            "height": self.height,
+            "background_color": self.background_color,
+            "padding": self.padding,
+            "margin": self.margin
+        }
+
+    def _bind_text_getter(self, source) -> None:
+        """
+        Specialize the text accessor for the source's type.
+
+        The State-or-string check runs once here instead of on every
+        text read; build() then calls a monomorphic closure.
+
+        Args:
+            source: The text string or State backing this label
+        """
+        if isinstance(source, State):
+            # Formatted is cached per value change on the State side
+            self._get_text = lambda s=source: s.formatted
+        else:
+            cached = source if type(source) is str else str(source)
+            self._get_text = lambda t=cached: t
+
     @property
     def text(self) -> str:
         """
         Get the current text value.
-        
+
         Returns:
             The text string
         """
-        if isinstance(self._text_source, State):
-            return str(self._text_source.value)
-        return str(self._text_source)
-    
-    def build(self) -> dict:
+        return self._get_text()
+
+    @text.setter
+    def text(self, new_text) -> None:
+        """
+        Replace the label's text source.
+
+        Allows long-lived labels (e.g. pre-built panels) to be updated in
+        place instead of being reconstructed on every rebuild.
+
+        Args:
+            new_text: New text string or State to display
+        """
+        old_source = self._text_source
+        self._text_source = new_text
+        self._bind_text_getter(new_text)
+        # Re-assigning the same State must not stack another
+        # subscription on it; swapping to a new one does need a watch
+        if isinstance(new_text, State) and new_text is not old_source:
+            self.watch(new_text)
+        # The cached build now shows stale text
+        self._mark_dirty()
+
+    def _build_impl(self) -> dict:
         """
         Build the label's visual representation.
-        
+
         Returns:
             Dictionary describing the label
         """
-        return {
-            "type": "label",
-            "text": self.text,
-            "font_size": self.font_size,
-            "font_family": self.font_family,
-            "color": self.color,
-            "text_align": self.text_align,
-            "width": self.width,
-            "height": self.height,
-            "background_color": self.background_color,
-            "padding": self.padding,
-            "margin": self.margin,
-            "position": (self.x, self.y)
-        }
+        # One C-level table copy plus the two dynamic keys beats
+        # re-inserting a dozen entries per build
+        d = self._template.copy()
+        d["text"] = self._get_text()
+        d["position"] = self._pos
+        return d
@@ -2,8 +2,9 @@
 Slider widget for numeric value selection
 """
 
+from sys import intern
 from typing import Optional, Callable
-from pocketpy.widgets.base import Widget
+from pocketpy.widgets.base import Widget, _noop
 from pocketpy.core.state import State
 
 
@@ -54,42 +55,120 @@ class Slider(Widget):
         self._value_source = value
         self.min_value = min_value
         self.max_value = max_value
-        self.step = step
-        self.track_color = track_color
-        self.active_color = active_color
-        self.thumb_color = thumb_color
+        self.step = step  # also derives _inv_step via the property
+        # Intern style strings so repeated rebuilds share one object each
+        self.track_color = intern(track_color)
+        self.active_color = intern(active_color)
+        self.thumb_color = intern(thumb_color)
         self.disabled = disabled
-        self.on_change = on_change
+        # A shared no-op stands in for absent handlers so the drag path
+        # never branches on None
+        self.on_change = on_change if on_change is not None else _noop
         
         self._is_dragging = False
-        
+
+        # Cached span and reciprocal: build() and handle_drag() each
+        # use them instead of re-deriving max - min per call
+        self._range_span = max_value - min_value
+        self._inv_range_span = (1.0 / self._range_span
+                                if self._range_span else 0.0)
+
+        # Value accessors plus the static half of the build dict,
+        # including the bound drag handler; _build_impl copies the
+        # template and fills the dynamic slots
+        self._refresh_template()
+
         if isinstance(value, State):
-            self.watch(value)
-    
+            self.watch(value, lambda s=value: setattr(
+                self, "_cached_value", float(s.value)))
+
+    def _bind_value_source(self, source) -> None:
+        """
+        Specialize the value accessor pair for the source's type.
+
+        The current value is kept pre-cast in _cached_value, so reads
+        are one attribute load: _write refreshes it, and for
+        State-backed values the watcher set up in __init__ pushes
+        external changes into it. The plain-value closure captures this
+        instance, which is why reconcile regenerates the pair on the
+        retained widget instead of copying it.
+
+        Args:
+            source: The value or State backing this slider
+        """
+        if isinstance(source, State):
+            self._cached_value = float(source.value)
+            self._write = lambda v, s=source: setattr(s, "value", v)
+        else:
+            self._cached_value = float(source)
+
+            def _write(v):
+                self._value_source = v
+                self._cached_value = float(v)
+
+            self._write = _write
+
+    def _refresh_template(self) -> None:
+        """Rewrite the derived accessors and static build dict."""
+        self._bind_value_source(self._value_source)
+        self._template = {
+            "type": "slider",
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "track_color": self.track_color,
+            "active_color": self.active_color,
+            "thumb_color": self.thumb_color,
+            "disabled": self.disabled,
+            "width": self.width or 200,
+            "height": self.height or 4,
+            "margin": self.margin,
+            "on_drag": self.handle_drag
+        }
+
+    @property
+    def step(self) -> float:
+        """Step increment applied by set_value."""
+        return self._step
+
+    @step.setter
+    def step(self, value: float) -> None:
+        """
+        Store the step and its cached reciprocal.
+
+        The reciprocal turns the per-drag-event division into a
+        multiplication; zero means "no stepping".
+
+        Args:
+            value: Step increment (0 disables stepping)
+        """
+        self._step = value
+        self._inv_step = 1.0 / value if value > 0 else 0.0
+
     @property
     def value(self) -> float:
         """Get current slider value"""
-        if isinstance(self._value_source, State):
-            return float(self._value_source.value)
-        return float(self._value_source)
+        return self._cached_value
     
     def set_value(self, new_value: float) -> None:
         """Set slider value"""
-        # Clamp to range
-        clamped = max(self.min_value, min(self.max_value, new_value))
-        
-        # Apply step
-        if self.step > 0:
-            clamped = round(clamped / self.step) * self.step
-        
-        if isinstance(self._value_source, State):
-            self._value_source.value = clamped
-        else:
-            self._value_source = clamped
-        
-        if self.on_change:
-            self.on_change(clamped)
-        
+        # Clamp with inline conditionals and step with the cached
+        # reciprocal: no max()/min() call overhead per drag event. The
+        # int(x + 0.5) trick is wrong for negative positions (it rounds
+        # toward zero), so rounding stays with round()
+        lo = self.min_value
+        hi = self.max_value
+        clamped = lo if new_value < lo else (hi if new_value > hi else new_value)
+        inv_step = self._inv_step
+        if inv_step:
+            clamped = round(clamped * inv_step) * self._step
+
+        # Consecutive drag positions often step to the same value; a
+        # no-op write would still fire the callback and a full rebuild
+        if clamped == self.value:
+            return
+
+        self._write(clamped)
+        self.on_change(clamped)
         self._trigger_rebuild()
     
     def handle_drag(self, x: float, width: float) -> None:
@@ -101,27 +180,17 @@ class Slider(Widget):
         percentage = max(0, min(1, x / width))
         
         # Map to value range
-        new_value = self.min_value + percentage * (self.max_value - self.min_value)
+        new_value = self.min_value + percentage * self._range_span
         self.set_value(new_value)
     
-    def build(self) -> dict:
+    def _build_impl(self) -> dict:
         """Build the slider's visual representation"""
         # Calculate percentage for rendering
-        percentage = (self.value - self.min_value) / (self.max_value - self.min_value)
-        
-        return {
-            "type": "slider",
-            "value": self.value,
-            "percentage": percentage,
-            "min_value": self.min_value,
-            "max_value": self.max_value,
-            "track_color": self.track_color,
-            "active_color": self.active_color,
-            "thumb_color": self.thumb_color,
-            "disabled": self.disabled,
-            "width": self.width or 200,
-            "height": self.height or 4,
-            "margin": self.margin,
-            "position": (self.x, self.y),
-            "on_drag": self.handle_drag
-        }
+        value = self.value
+        percentage = (value - self.min_value) * self._inv_range_span
+
+        d = self._template.copy()
+        d["value"] = value
+        d["percentage"] = percentage
+        d["position"] = self._pos
+        return d
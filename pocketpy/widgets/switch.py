@@ -2,8 +2,9 @@
 Switch widget for boolean toggle
 """
 
+from sys import intern
 from typing import Optional, Callable
-from pocketpy.widgets.base import Widget
+from pocketpy.widgets.base import Widget, _noop
 from pocketpy.core.state import State
 
 
@@ -27,11 +28,12 @@ class Switch(Widget):
         thumb_color: str = "#FFFFFF",
         disabled: bool = False,
         on_change: Optional[Callable[[bool], None]] = None,
+        user_data: Optional[object] = None,
         **kwargs
     ):
         """
         Initialize a Switch widget.
-        
+
         Args:
             value: Current state (can be State object)
             on_color: Color when switch is on
@@ -39,26 +41,77 @@ class Switch(Widget):
             thumb_color: Color of the sliding thumb
             disabled: Whether switch is disabled
             on_change: Callback when value changes
+            user_data: Optional payload passed to on_change, letting many
+                switches share one handler instead of per-item closures
             **kwargs: Additional styling properties
         """
         super().__init__(**kwargs)
         
         self._value_source = value
-        self.on_color = on_color
-        self.off_color = off_color
-        self.thumb_color = thumb_color
+        # Intern style strings so repeated rebuilds share one object each
+        self.on_color = intern(on_color)
+        self.off_color = intern(off_color)
+        self.thumb_color = intern(thumb_color)
         self.disabled = disabled
-        self.on_change = on_change
-        
+        # A shared no-op stands in for an absent handler so toggle()
+        # never branches on None
+        self.on_change = on_change if on_change is not None else _noop
+        self.user_data = user_data
+
+        # Value accessors plus the static half of the build dict,
+        # including the bound toggle handler; _build_impl copies the
+        # template and fills the dynamic slots
+        self._refresh_template()
+
         if isinstance(value, State):
-            self.watch(value)
-    
+            self.watch(value, lambda s=value: setattr(
+                self, "_cached_value", bool(s.value)))
+
+    def _bind_value_source(self, source) -> None:
+        """
+        Specialize the value accessor pair for the source's type.
+
+        The current value is kept pre-cast in _cached_value, so reads
+        are one attribute load: _write refreshes it, and for
+        State-backed values the watcher set up in __init__ pushes
+        external changes into it. The plain-value closure captures this
+        instance, which is why reconcile regenerates the pair on the
+        retained widget instead of copying it.
+
+        Args:
+            source: The value or State backing this switch
+        """
+        if isinstance(source, State):
+            self._cached_value = bool(source.value)
+            self._write = lambda v, s=source: setattr(s, "value", v)
+        else:
+            self._cached_value = bool(source)
+
+            def _write(v):
+                self._value_source = v
+                self._cached_value = bool(v)
+
+            self._write = _write
+
+    def _refresh_template(self) -> None:
+        """Rewrite the derived accessors and static build dict."""
+        self._bind_value_source(self._value_source)
+        self._template = {
+            "type": "switch",
+            "on_color": self.on_color,
+            "off_color": self.off_color,
+            "thumb_color": self.thumb_color,
+            "disabled": self.disabled,
+            "width": self.width or 51,
+            "height": self.height or 31,
+            "margin": self.margin,
+            "on_press": self.toggle
+        }
+
     @property
     def value(self) -> bool:
         """Get current switch state"""
-        if isinstance(self._value_source, State):
-            return bool(self._value_source.value)
-        return bool(self._value_source)
+        return self._cached_value
     
     def toggle(self) -> None:
         """Toggle the switch"""
@@ -67,28 +120,18 @@ class Switch(Widget):
         
         new_value = not self.value
         
-        if isinstance(self._value_source, State):
-            self._value_source.value = new_value
+        self._write(new_value)
+
+        if self.user_data is not None:
+            self.on_change(new_value, self.user_data)
         else:
-            self._value_source = new_value
-        
-        if self.on_change:
             self.on_change(new_value)
-        
+
         self._trigger_rebuild()
     
-    def build(self) -> dict:
+    def _build_impl(self) -> dict:
         """Build the switch's visual representation"""
-        return {
-            "type": "switch",
-            "value": self.value,
-            "on_color": self.on_color,
-            "off_color": self.off_color,
-            "thumb_color": self.thumb_color,
-            "disabled": self.disabled,
-            "width": self.width or 51,
-            "height": self.height or 31,
-            "margin": self.margin,
-            "position": (self.x, self.y),
-            "on_press": self.toggle
-        }
+        d = self._template.copy()
+        d["value"] = self.value
+        d["position"] = self._pos
+        return d
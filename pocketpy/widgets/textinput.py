@@ -2,10 +2,14 @@
 TextInput widget for text entry
 """
 
+from sys import intern
 from typing import Optional, Callable
-from pocketpy.widgets.base import Widget
+from pocketpy.widgets.base import Widget, _noop
 from pocketpy.core.state import State
 
+# Mask character for secure fields
+_BULLET = "\u2022"
+
 
 class TextInput(Widget):
     """
@@ -67,44 +71,101 @@ class TextInput(Widget):
         self._value_source = value
         self.placeholder = placeholder
         self.font_size = font_size
-        self.font_family = font_family
-        self.color = color
-        self.background_color = background_color
-        self.border_color = border_color
-        self.focus_border_color = focus_border_color
-        self.placeholder_color = placeholder_color
+        # Intern style strings so repeated rebuilds share one object each
+        self.font_family = intern(font_family)
+        self.color = intern(color)
+        self.background_color = intern(background_color)
+        self.border_color = intern(border_color)
+        self.focus_border_color = intern(focus_border_color)
+        self.placeholder_color = intern(placeholder_color)
         self.secure = secure
         self.multiline = multiline
         self.max_length = max_length
-        self.on_change = on_change
-        self.on_submit = on_submit
-        self.on_focus = on_focus
-        self.on_blur = on_blur
+        # Shared no-ops stand in for absent handlers so the keystroke
+        # and focus paths never branch on None
+        self.on_change = on_change if on_change is not None else _noop
+        self.on_submit = on_submit if on_submit is not None else _noop
+        self.on_focus = on_focus if on_focus is not None else _noop
+        self.on_blur = on_blur if on_blur is not None else _noop
         
         self._is_focused = False
         self._cursor_position = 0
-        
+
+        # Reusable keystroke edit buffer (see _commit_edit)
+        self._chars: Optional[list] = None
+        self._chars_value: Optional[str] = None
+
+        # Last secure-mode mask and the length it was built for
+        self._mask_cache = ("", 0)
+
+        # Value accessors plus the static half of the build dict,
+        # including the bound handlers; _build_impl copies the template
+        # and fills the dynamic slots
+        self._refresh_template()
+
         if isinstance(value, State):
-            self.watch(value)
-    
+            self.watch(value, lambda s=value: setattr(
+                self, "_cached_value", str(s.value)))
+
+    def _bind_value_source(self, source) -> None:
+        """
+        Specialize the value accessor pair for the source's type.
+
+        The current value is kept pre-cast in _cached_value, so reads
+        are one attribute load: _write refreshes it, and for
+        State-backed values the watcher set up in __init__ pushes
+        external changes into it. The plain-value closure captures this
+        instance, which is why reconcile regenerates the pair on the
+        retained widget instead of copying it.
+
+        Args:
+            source: The text string or State backing this input
+        """
+        if isinstance(source, State):
+            self._cached_value = str(source.value)
+            self._write = lambda v, s=source: setattr(s, "value", v)
+        else:
+            self._cached_value = str(source)
+
+            def _write(v):
+                self._value_source = v
+                self._cached_value = str(v)
+
+            self._write = _write
+
+    def _refresh_template(self) -> None:
+        """Rewrite the derived accessors and static build dict."""
+        self._bind_value_source(self._value_source)
+        self._template = {
+            "type": "textinput",
+            "font_size": self.font_size,
+            "font_family": self.font_family,
+            "color": self.color,
+            "placeholder_color": self.placeholder_color,
+            "background_color": self.background_color,
+            "width": self.width or 200,
+            "height": self.height or 40,
+            "padding": self.padding or (8, 12),
+            "margin": self.margin,
+            "on_key_press": self.handle_key_press,
+            "on_focus": self.handle_focus,
+            "on_blur": self.handle_blur
+        }
+
     @property
     def value(self) -> str:
         """Get current text value"""
-        if isinstance(self._value_source, State):
-            return str(self._value_source.value)
-        return str(self._value_source)
+        return self._cached_value
     
     @value.setter
     def value(self, new_value: str):
         """Set text value"""
-        if isinstance(self._value_source, State):
-            self._value_source.value = new_value
-        else:
-            self._value_source = new_value
-        
-        if self.on_change:
-            self.on_change(new_value)
-        
+        # Programmatic re-assignment of the same text (e.g. external
+        # state sync) should not fire on_change or rebuild
+        if new_value == self.value:
+            return
+        self._write(new_value)
+        self.on_change(new_value)
         self._trigger_rebuild()
     
     def handle_key_press(self, key: str) -> None:
@@ -113,55 +174,79 @@ class TextInput(Widget):
         
         if key == "backspace":
             if len(current) > 0:
-                self.value = current[:-1]
+                self._commit_edit(current, None)
         elif key == "enter":
-            if not self.multiline and self.on_submit:
+            if not self.multiline:
                 self.on_submit(current)
-            elif self.multiline:
-                self.value = current + "\n"
+            else:
+                self._commit_edit(current, "\n")
         elif len(key) == 1:
             if self.max_length is None or len(current) < self.max_length:
-                self.value = current + key
+                self._commit_edit(current, key)
+
+    def _commit_edit(self, current: str, ch: Optional[str]) -> None:
+        """
+        Apply one keystroke edit and push the result out.
+
+        Consecutive keystrokes reuse one character list, so appends and
+        deletions are amortized O(1) instead of re-slicing the whole
+        string; the buffer is rebuilt only when the value was changed
+        from outside (setter or State write). The new value is known to
+        differ, so this skips the setter's equality compare.
+
+        Args:
+            current: The text before this keystroke
+            ch: Character to append, or None to delete the last one
+        """
+        chars = self._chars
+        if chars is None or self._chars_value != current:
+            chars = list(current)
+            self._chars = chars
+        if ch is None:
+            chars.pop()
+        else:
+            chars.append(ch)
+        new_value = "".join(chars)
+        self._chars_value = new_value
+
+        self._write(new_value)
+        self.on_change(new_value)
+        # Keystrokes can arrive in bursts; coalesce to one rebuild on
+        # the next frame
+        self._schedule_rebuild()
     
     def handle_focus(self) -> None:
         """Handle focus event"""
         self._is_focused = True
-        if self.on_focus:
-            self.on_focus()
+        self.on_focus()
         self._trigger_rebuild()
     
     def handle_blur(self) -> None:
         """Handle blur event"""
         self._is_focused = False
-        if self.on_blur:
-            self.on_blur()
+        self.on_blur()
         self._trigger_rebuild()
     
-    def build(self) -> dict:
+    def _build_impl(self) -> dict:
         """Build the text input's visual representation"""
-        current_border = self.focus_border_color if self._is_focused else self.border_color
-        
+        is_focused = self._is_focused
+        current_border = self.focus_border_color if is_focused else self.border_color
+
         display_text = self.value
         if self.secure and display_text:
-            display_text = "•" * len(display_text)
-        
-        return {
-            "type": "textinput",
-            "text": display_text,
-            "placeholder": self.placeholder if not display_text else "",
-            "font_size": self.font_size,
-            "font_family": self.font_family,
-            "color": self.color,
-            "placeholder_color": self.placeholder_color,
-            "background_color": self.background_color,
-            "border_color": current_border,
-            "is_focused": self._is_focused,
-            "width": self.width or 200,
-            "height": self.height or 40,
-            "padding": self.padding or (8, 12),
-            "margin": self.margin,
-            "position": (self.x, self.y),
-            "on_key_press": self.handle_key_press,
-            "on_focus": self.handle_focus,
-            "on_blur": self.handle_blur
-        }
+            # The mask depends only on the length, which moves by one
+            # per keystroke; reuse the last string when it still fits
+            n = len(display_text)
+            cached, cached_n = self._mask_cache
+            if cached_n != n:
+                cached = _BULLET * n
+                self._mask_cache = (cached, n)
+            display_text = cached
+
+        d = self._template.copy()
+        d["text"] = display_text
+        d["placeholder"] = self.placeholder if not display_text else ""
+        d["border_color"] = current_border
+        d["is_focused"] = is_focused
+        d["position"] = self._pos
+        return d
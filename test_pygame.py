@@ -26,7 +26,7 @@ class TestView(View):
             Button(
                 text="Increment",
                 font_size=20,
-                on_press=lambda: setattr(self.counter, 'value', self.counter.value + 1)
+                on_press=self.increment
             )
         ])
 